@@ -0,0 +1,122 @@
+"""
+AI Response Cache Module
+
+Exact-match cache for AI responses.
+Identical requests (same model, sampling settings and messages) are
+answered from the cache instead of calling the API again.
+
+Author: Brain-Time
+Project: Productivity Coach
+"""
+
+from collections import OrderedDict
+import threading
+from typing import Dict, List, Optional
+
+import orjson
+import xxhash
+
+from ai_config import AIConfig
+from database import (
+    get_response_cache_entry,
+    save_response_cache_entry
+)
+
+
+# ============================================================================
+# CACHE CONFIGURATION
+# ============================================================================
+
+MEMORY_CACHE_SIZE = 128
+RESPONSE_CACHE_MAX_ENTRIES = 1000  # SQLite level; oldest responses dropped first
+
+# In-memory LRU (first level); SQLite is the persistent second level.
+# Shared by all Streamlit script threads: every access holds _memory_lock
+_memory_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+# ============================================================================
+# CACHE KEYS
+# ============================================================================
+
+def make_cache_key(config: AIConfig, messages: List[Dict]) -> bytes:
+    """
+    Build a cache key for a request.
+
+    Args:
+        config: AI config the request is sent with
+        messages: Messages array sent to the API
+
+    Returns:
+        16-byte digest identifying the request
+    """
+    payload = orjson.dumps(
+        {
+            "model": config.model,
+            "temperature": config.temperature,
+            "max_tokens": config.max_tokens,
+            "messages": messages
+        },
+        option=orjson.OPT_SORT_KEYS
+    )
+    return xxhash.xxh3_128_digest(payload)
+
+
+# ============================================================================
+# CACHE OPERATIONS
+# ============================================================================
+
+def get_cached_response(config: AIConfig, messages: List[Dict]) -> Optional[str]:
+    """
+    Get a cached response for an identical earlier request.
+
+    Args:
+        config: AI config the request is sent with
+        messages: Messages array sent to the API
+
+    Returns:
+        Cached response content or None
+    """
+    key = make_cache_key(config, messages)
+
+    with _memory_lock:
+        response = _memory_cache.get(key)
+        if response is not None:
+            _memory_cache.move_to_end(key)
+            return response
+
+    response = get_response_cache_entry(key)
+    if response is not None:
+        _remember(key, response)
+
+    return response
+
+
+def put_cached_response(config: AIConfig, messages: List[Dict], response: str) -> None:
+    """
+    Store a response for later identical requests.
+
+    Args:
+        config: AI config the request is sent with
+        messages: Messages array sent to the API
+        response: Response content
+    """
+    key = make_cache_key(config, messages)
+    _remember(key, response)
+    save_response_cache_entry(key, response, RESPONSE_CACHE_MAX_ENTRIES)
+
+
+def clear_memory_cache() -> None:
+    """Clear the in-memory cache level."""
+    with _memory_lock:
+        _memory_cache.clear()
+
+
+def _remember(key: bytes, response: str) -> None:
+    """Insert into the in-memory LRU, evicting the oldest entry if full."""
+    with _memory_lock:
+        _memory_cache[key] = response
+        _memory_cache.move_to_end(key)
+        if len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
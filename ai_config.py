@@ -8,8 +8,21 @@ Author: Brain-Time
 Project: Productivity Coach
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from types import MappingProxyType
+import functools
 import json
+import sys
+
+
+# ============================================================================
+# MESSAGE KEYS & ROLES
+# ============================================================================
+
+_ROLE = sys.intern("role")
+_CONTENT = sys.intern("content")
+_SYSTEM = sys.intern("system")
+_USER = sys.intern("user")
 
 
 # ============================================================================
@@ -90,6 +103,12 @@ Provide:
 - Keep total response under 100 words""",
 }
 
+# Shared string objects for prompts reused across cached configs/messages
+DEFAULT_SYSTEM_MESSAGES = {
+    feature: sys.intern(message)
+    for feature, message in DEFAULT_SYSTEM_MESSAGES.items()
+}
+
 
 # ============================================================================
 # LANGUAGE CONFIGURATION
@@ -151,6 +170,22 @@ LANGUAGES = {
 }
 
 
+# Language names offered in the onboarding language selector
+LANGUAGE_OPTIONS = tuple(lang["name"] for lang in LANGUAGES.values())
+
+# Language name (as shown in the UI / onboarding answers) -> code
+_LANGUAGE_NAME_TO_CODE = MappingProxyType({
+    **{lang["name"]: code for code, lang in LANGUAGES.items()},
+    "العربية (Arabic)": "ar",
+})
+
+_VALID_LANG_CODES = frozenset(LANGUAGES)
+
+# Flat per-code lookups (fast path for the helpers below)
+_AI_INSTRUCTIONS = {code: lang["ai_instruction"] for code, lang in LANGUAGES.items()}
+_UI_STRINGS = {code: lang["ui_strings"] for code, lang in LANGUAGES.items()}
+
+
 # ============================================================================
 # ONBOARDING QUESTIONS
 # ============================================================================
@@ -262,26 +297,38 @@ ONBOARDING_QUESTIONS = [
     }
 ]
 
+# Read-only view: shared across sessions and reruns without copying
+ONBOARDING_QUESTIONS = tuple(
+    MappingProxyType({**question, "options": tuple(question["options"])})
+    for question in ONBOARDING_QUESTIONS
+)
+
+_QUESTIONS_BY_ID = {question["id"]: question for question in ONBOARDING_QUESTIONS}
+
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+@functools.lru_cache(maxsize=32)
 def get_model(feature: str) -> str:
     """Get model name for a specific feature."""
     return MODELS.get(feature, MODELS["quick_task"])
 
 
+@functools.lru_cache(maxsize=32)
 def get_temperature(feature: str) -> float:
     """Get temperature for a specific feature."""
     return TEMPERATURES.get(feature, 0.7)
 
 
+@functools.lru_cache(maxsize=32)
 def get_max_tokens(feature: str) -> int:
     """Get max tokens for a specific feature."""
     return MAX_TOKENS.get(feature, 300)
 
 
+@functools.lru_cache(maxsize=32)
 def get_system_message(feature: str) -> str:
     """Get default system message for a specific feature."""
     return DEFAULT_SYSTEM_MESSAGES.get(
@@ -290,18 +337,90 @@ def get_system_message(feature: str) -> str:
     )
 
 
+@functools.lru_cache(maxsize=32)
 def get_language_instruction(language_code: str) -> str:
     """Get AI instruction for responding in specific language."""
-    return LANGUAGES.get(language_code, LANGUAGES["en"])["ai_instruction"]
+    code = language_code if language_code in _VALID_LANG_CODES else "en"
+    return _AI_INSTRUCTIONS[code]
 
 
 def get_ui_string(language_code: str, key: str) -> str:
     """Get UI string in user's language."""
-    lang = LANGUAGES.get(language_code, LANGUAGES["en"])
-    return lang["ui_strings"].get(key, key)
+    code = language_code if language_code in _VALID_LANG_CODES else "en"
+    return _UI_STRINGS[code].get(key, key)
+
+
+class AIConfig(NamedTuple):
+    """Complete AI configuration for a feature (immutable, shareable)."""
+    model: str
+    temperature: float
+    max_tokens: int
+    system_message: str
+
+
+@functools.lru_cache(maxsize=128)
+def _get_ai_config_cached(
+    feature: str,
+    system_message_override: Optional[str],
+    language_code: Optional[str]
+) -> AIConfig:
+    """Build the AIConfig for a feature and its personalization fields."""
+    system_message = system_message_override or get_system_message(feature)
+    
+    if language_code is not None:
+        language_instruction = get_language_instruction(language_code)
+        system_message += f"\n\nIMPORTANT: {language_instruction}"
+    
+    return AIConfig(
+        model=get_model(feature),
+        temperature=get_temperature(feature),
+        max_tokens=get_max_tokens(feature),
+        system_message=system_message,
+    )
+
+
+# Non-personalized configs, returned as-is when there is no user profile
+_DEFAULT_CONFIGS = {
+    feature: _get_ai_config_cached(feature, None, None) for feature in MODELS
+}
+
+
+def _personalization_key(
+    feature: str,
+    user_profile: Dict
+) -> Tuple[Optional[str], Optional[str]]:
+    """Extract the profile fields that affect a feature's config."""
+    system_message_override = user_profile.get("system_message_" + feature)
+    language_code = None
+    if "onboarding_data" in user_profile:
+        language = user_profile["onboarding_data"].get("language", "English")
+        language_code = get_language_code(language)
+    return system_message_override, language_code
 
 
-def get_ai_config(feature: str, user_profile: Optional[Dict] = None) -> Dict:
+def finalize_profile(user_profile: Dict) -> Dict:
+    """
+    Precompute the final system message for every feature.
+    
+    Stores the personalized (or default) system message with the language
+    instruction already appended, so get_ai_config can use it as-is.
+    
+    Args:
+        user_profile: User profile to finalize (modified in place)
+        
+    Returns:
+        The same profile dict
+    """
+    for feature in MODELS:
+        system_message = _get_ai_config_cached(
+            feature, *_personalization_key(feature, user_profile)
+        ).system_message
+        user_profile["final_system_message_" + feature] = system_message
+    
+    return user_profile
+
+
+def get_ai_config(feature: str, user_profile: Optional[Dict] = None) -> AIConfig:
     """
     Get complete AI configuration for a feature.
     
@@ -310,46 +429,43 @@ def get_ai_config(feature: str, user_profile: Optional[Dict] = None) -> Dict:
         user_profile: Optional user profile for personalization
         
     Returns:
-        Dict with model, temperature, system_message, max_tokens
+        AIConfig with model, temperature, max_tokens, system_message
     """
-    config = {
-        "model": get_model(feature),
-        "temperature": get_temperature(feature),
-        "max_tokens": get_max_tokens(feature),
-    }
+    if not user_profile and feature in _DEFAULT_CONFIGS:
+        return _DEFAULT_CONFIGS[feature]
     
-    # Use personalized system message if available
-    if user_profile and "system_message_" + feature in user_profile:
-        config["system_message"] = user_profile["system_message_" + feature]
-    else:
-        config["system_message"] = get_system_message(feature)
+    system_message_override = None
+    language_code = None
     
-    # Add language instruction if user profile exists
-    if user_profile and "onboarding_data" in user_profile:
-        language = user_profile["onboarding_data"].get("language", "English")
-        language_code = get_language_code(language)
-        language_instruction = get_language_instruction(language_code)
-        config["system_message"] += f"\n\nIMPORTANT: {language_instruction}"
+    if user_profile:
+        # Prefer the message precomputed by finalize_profile (language included)
+        final_message = user_profile.get("final_system_message_" + feature)
+        if final_message is not None:
+            system_message_override = final_message
+        else:
+            system_message_override, language_code = _personalization_key(
+                feature, user_profile
+            )
     
-    return config
+    return _get_ai_config_cached(feature, system_message_override, language_code)
+
+
+def get_question_options(question_id: str) -> Tuple[str, ...]:
+    """Get the (immutable) answer options of an onboarding question."""
+    return _QUESTIONS_BY_ID[question_id]["options"]
 
 
 def get_language_code(language_name: str) -> str:
     """Convert language name to code."""
-    mapping = {
-        "English": "en",
-        "Deutsch": "de",
-        "العربية (Arabic)": "ar",
-        "Français": "fr"
-    }
-    return mapping.get(language_name, "en")
+    return _LANGUAGE_NAME_TO_CODE.get(language_name, "en")
 
 
 def create_messages(
     feature: str,
     user_input: str,
     user_profile: Optional[Dict] = None,
-    conversation_history: Optional[List[Dict]] = None
+    conversation_history: Optional[List[Dict]] = None,
+    config: Optional[AIConfig] = None
 ) -> List[Dict]:
     """
     Create messages array for API call.
@@ -359,65 +475,19 @@ def create_messages(
         user_input: User's current input
         user_profile: Optional user profile
         conversation_history: Optional previous messages
+        config: Optional config already resolved via get_ai_config
         
     Returns:
         List of message dicts
     """
-    config = get_ai_config(feature, user_profile)
+    if config is None:
+        config = get_ai_config(feature, user_profile)
     
-    messages = [
-        {"role": "system", "content": config["system_message"]}
+    # System prompt, previous turns, current user input - built in one go.
+    # Every dict is new (callers may mutate them); the prompt string is shared
+    return [
+        {_ROLE: _SYSTEM, _CONTENT: config.system_message},
+        *(conversation_history or ()),
+        {_ROLE: _USER, _CONTENT: user_input},
     ]
-    
-    # Add conversation history if provided
-    if conversation_history:
-        messages.extend(conversation_history)
-    
-    # Add current user input
-    messages.append({"role": "user", "content": user_input})
-    
-    return messages
-
-
-# ============================================================================
-# TESTING
-# ============================================================================
 
-if __name__ == "__main__":
-    print("=" * 60)
-    print("AI CONFIG MODULE TEST")
-    print("=" * 60)
-    
-    # Test 1: Get config without profile
-    print("\n1. Default Configuration:")
-    config = get_ai_config("daily_planning")
-    print(f"   Model: {config['model']}")
-    print(f"   Temperature: {config['temperature']}")
-    print(f"   Max Tokens: {config['max_tokens']}")
-    print(f"   System Message: {config['system_message'][:100]}...")
-    
-    # Test 2: Get config with profile
-    print("\n2. Personalized Configuration:")
-    mock_profile = {
-        "system_message_daily_planning": "You are a coach for busy parents...",
-        "onboarding_data": {"language": "Deutsch"}
-    }
-    config = get_ai_config("daily_planning", mock_profile)
-    print(f"   System Message: {config['system_message'][:100]}...")
-    
-    # Test 3: Create messages
-    print("\n3. Messages Array:")
-    messages = create_messages(
-        "daily_planning",
-        "I have 3 hours today",
-        mock_profile
-    )
-    print(f"   Number of messages: {len(messages)}")
-    print(f"   First message role: {messages[0]['role']}")
-    
-    # Test 4: Language support
-    print("\n4. Language Support:")
-    for lang_code, lang_data in LANGUAGES.items():
-        print(f"   {lang_data['name']}: {get_ui_string(lang_code, 'welcome')}")
-    
-    print("\n✅ All tests passed!")
@@ -10,26 +10,32 @@ Project: Productivity Coach
 import streamlit as st
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
+import io
 import os
-from groq import Groq
 
 # Import our modules
 from ai_config import (
-    ONBOARDING_QUESTIONS,
-    LANGUAGES,
+    AIConfig,
+    LANGUAGE_OPTIONS,
     get_ai_config,
     get_language_code,
-    get_ui_string,
+    get_question_options,
     create_messages
 )
-from onboarding import generate_user_profile, validate_profile
+from ai_cache import (
+    make_cache_key,
+    get_cached_response,
+    put_cached_response,
+    clear_memory_cache
+)
+from ui_strings import get_strings, preload_language
 from database import (
     init_database,
     save_user_profile,
     get_active_user_profile,
     save_daily_plan,
     get_daily_plan,
-    get_recent_daily_plans,
+    get_recent_daily_plan_summaries,
     save_weekly_review,
     get_all_weekly_reviews,
     get_database_stats,
@@ -109,6 +115,9 @@ def init_session_state():
     
     if 'show_plan_code' not in st.session_state:
         st.session_state.show_plan_code = False
+    
+    if 'groq_response_cache' not in st.session_state:
+        st.session_state.groq_response_cache = {}
 
 
 # ============================================================================
@@ -118,6 +127,8 @@ def init_session_state():
 @st.cache_resource
 def get_groq_client():
     """Get cached Groq client."""
+    from groq import Groq  # Deferred: only needed once we call the API
+    
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         st.error("❌ GROQ_API_KEY not found in .env file!")
@@ -125,358 +136,69 @@ def get_groq_client():
     return Groq(api_key=api_key)
 
 
-# ============================================================================
-# LANGUAGE STRINGS
-# ============================================================================
-
-UI_STRINGS = {
-    'en': {
-        'welcome_title': '🎯 Welcome to Your Productivity Coach',
-        'welcome_subtitle': "Let's personalize your experience!",
-        'welcome_description': 'Answer a few questions so I can tailor the coaching to your unique situation. This will take about **2 minutes**.',
-        'q1_title': '1️⃣ Language / Sprache / اللغة',
-        'q1_label': 'Which language would you like to use?',
-        'q2_title': '2️⃣ Your Role',
-        'q2_label': 'What best describes you?',
-        'q3_title': '3️⃣ Your Goals',
-        'q3_label': 'What are your main goals? (Select all that apply)',
-        'q4_title': '4️⃣ Available Time',
-        'q4_label': 'How much focused time do you typically have per day?',
-        'q5_title': '5️⃣ Main Challenge',
-        'q5_label': "What's your biggest productivity challenge?",
-        'q6_title': '6️⃣ Islamic Practice (Optional)',
-        'q6_label': 'How would you describe your Islamic practice?',
-        'q7_title': '7️⃣ Motivation Style',
-        'q7_label': 'What motivates you most?',
-        'submit_btn': '🚀 Generate My Personalized Profile',
-        'generating': '🤖 AI is creating your personalized coaching profile...',
-        'success': '✅ Profile created successfully!',
-        'error_goals': '❌ Please select at least one goal!',
-        'preview_title': '👀 Preview Your Profile',
-        'preview_tone': '**Coaching Tone:**',
-        'preview_focus': '**Focus Areas:**',
-        'preview_timeblock': '**Time Block Size:**',
-        'preview_language': '**Language:**',
-    },
-    'de': {
-        'welcome_title': '🎯 Willkommen bei deinem Productivity Coach',
-        'welcome_subtitle': 'Lass uns deine Erfahrung personalisieren!',
-        'welcome_description': 'Beantworte ein paar Fragen, damit ich das Coaching auf deine einzigartige Situation zuschneiden kann. Das dauert etwa **2 Minuten**.',
-        'q1_title': '1️⃣ Sprache / Language / اللغة',
-        'q1_label': 'Welche Sprache möchtest du verwenden?',
-        'q2_title': '2️⃣ Deine Rolle',
-        'q2_label': 'Was beschreibt dich am besten?',
-        'q3_title': '3️⃣ Deine Ziele',
-        'q3_label': 'Was sind deine Hauptziele? (Wähle alle zutreffenden)',
-        'q4_title': '4️⃣ Verfügbare Zeit',
-        'q4_label': 'Wie viel konzentrierte Zeit hast du normalerweise pro Tag?',
-        'q5_title': '5️⃣ Hauptherausforderung',
-        'q5_label': 'Was ist deine größte Produktivitätsherausforderung?',
-        'q6_title': '6️⃣ Islamische Praxis (Optional)',
-        'q6_label': 'Wie würdest du deine islamische Praxis beschreiben?',
-        'q7_title': '7️⃣ Motivationsstil',
-        'q7_label': 'Was motiviert dich am meisten?',
-        'submit_btn': '🚀 Mein personalisiertes Profil erstellen',
-        'generating': '🤖 KI erstellt dein personalisiertes Coaching-Profil...',
-        'success': '✅ Profil erfolgreich erstellt!',
-        'error_goals': '❌ Bitte wähle mindestens ein Ziel aus!',
-        'preview_title': '👀 Vorschau deines Profils',
-        'preview_tone': '**Coaching-Ton:**',
-        'preview_focus': '**Schwerpunkte:**',
-        'preview_timeblock': '**Zeitblockgröße:**',
-        'preview_language': '**Sprache:**',
-    },
-    'ar': {
-        'welcome_title': '🎯 مرحباً بك في مدرب الإنتاجية الخاص بك',
-        'welcome_subtitle': 'دعنا نخصص تجربتك!',
-        'welcome_description': 'أجب عن بعض الأسئلة حتى أتمكن من تخصيص التدريب لحالتك الفريدة. سيستغرق هذا حوالي **دقيقتين**.',
-        'q1_title': '1️⃣ اللغة / Language / Sprache',
-        'q1_label': 'أي لغة تريد استخدامها؟',
-        'q2_title': '2️⃣ دورك',
-        'q2_label': 'ما الذي يصفك بشكل أفضل؟',
-        'q3_title': '3️⃣ أهدافك',
-        'q3_label': 'ما هي أهدافك الرئيسية؟ (اختر كل ما ينطبق)',
-        'q4_title': '4️⃣ الوقت المتاح',
-        'q4_label': 'كم من الوقت المركز لديك عادة في اليوم؟',
-        'q5_title': '5️⃣ التحدي الرئيسي',
-        'q5_label': 'ما هو أكبر تحدي إنتاجية لديك؟',
-        'q6_title': '6️⃣ الممارسة الإسلامية (اختياري)',
-        'q6_label': 'كيف تصف ممارستك الإسلامية؟',
-        'q7_title': '7️⃣ أسلوب التحفيز',
-        'q7_label': 'ما الذي يحفزك أكثر؟',
-        'submit_btn': '🚀 إنشاء ملفي الشخصي المخصص',
-        'generating': '🤖 الذكاء الاصطناعي يقوم بإنشاء ملف التدريب المخصص الخاص بك...',
-        'success': '✅ تم إنشاء الملف الشخصي بنجاح!',
-        'error_goals': '❌ يرجى اختيار هدف واحد على الأقل!',
-        'preview_title': '👀 معاينة ملفك الشخصي',
-        'preview_tone': '**نبرة التدريب:**',
-        'preview_focus': '**مجالات التركيز:**',
-        'preview_timeblock': '**حجم كتلة الوقت:**',
-        'preview_language': '**اللغة:**',
-    },
-    'fr': {
-        'welcome_title': '🎯 Bienvenue dans votre Coach de Productivité',
-        'welcome_subtitle': 'Personnalisons votre expérience!',
-        'welcome_description': 'Répondez à quelques questions pour que je puisse adapter le coaching à votre situation unique. Cela prendra environ **2 minutes**.',
-        'q1_title': '1️⃣ Langue / Language / Sprache',
-        'q1_label': 'Quelle langue souhaitez-vous utiliser?',
-        'q2_title': '2️⃣ Votre Rôle',
-        'q2_label': 'Qu\'est-ce qui vous décrit le mieux?',
-        'q3_title': '3️⃣ Vos Objectifs',
-        'q3_label': 'Quels sont vos principaux objectifs? (Sélectionnez tous ceux qui s\'appliquent)',
-        'q4_title': '4️⃣ Temps Disponible',
-        'q4_label': 'Combien de temps concentré avez-vous généralement par jour?',
-        'q5_title': '5️⃣ Défi Principal',
-        'q5_label': 'Quel est votre plus grand défi de productivité?',
-        'q6_title': '6️⃣ Pratique Islamique (Optionnel)',
-        'q6_label': 'Comment décririez-vous votre pratique islamique?',
-        'q7_title': '7️⃣ Style de Motivation',
-        'q7_label': 'Qu\'est-ce qui vous motive le plus?',
-        'submit_btn': '🚀 Générer Mon Profil Personnalisé',
-        'generating': '🤖 L\'IA crée votre profil de coaching personnalisé...',
-        'success': '✅ Profil créé avec succès!',
-        'error_goals': '❌ Veuillez sélectionner au moins un objectif!',
-        'preview_title': '👀 Aperçu de Votre Profil',
-        'preview_tone': '**Ton du Coaching:**',
-        'preview_focus': '**Domaines de Focus:**',
-        'preview_timeblock': '**Taille du Bloc de Temps:**',
-        'preview_language': '**Langue:**',
-    }
-}
-
-DAILY_PLANNING_STRINGS = {
-    'en': {
-        'title': '📅 Daily Plan',
-        'select_date': 'Select date:',
-        'available_hours': 'Available hours:',
-        'plan_exists': '📋 Plan already exists for',
-        'regenerate': '🔄 Regenerate Plan',
-        'add_context': '➕ Add Additional Context (Optional)',
-        'context_label': 'Any specific priorities or constraints for today?',
-        'context_placeholder': 'e.g., Doctor appointment at 2pm, need to finish project X',
-        'generate_btn': '✨ Generate Daily Plan',
-        'generating': '🤖 AI is creating your personalized plan...',
-        'success': '✅ Plan generated!',
-        'copy_btn': '📋 Copy to Clipboard',
-        'prompt_template': """I have {hours} hours available today ({date}).
-
-My focus areas: {focus}
-Preferred time blocks: {blocks} minutes
+SESSION_CACHE_SIZE = 64
 
-{context}
 
-Please create a realistic, time-blocked schedule for today."""
-    },
-    'de': {
-        'title': '📅 Tagesplan',
-        'select_date': 'Datum wählen:',
-        'available_hours': 'Verfügbare Stunden:',
-        'plan_exists': '📋 Plan existiert bereits für',
-        'regenerate': '🔄 Plan neu generieren',
-        'add_context': '➕ Zusätzlicher Kontext (Optional)',
-        'context_label': 'Spezifische Prioritäten oder Einschränkungen für heute?',
-        'context_placeholder': 'z.B. Arzttermin um 14 Uhr, muss Projekt X fertigstellen',
-        'generate_btn': '✨ Tagesplan erstellen',
-        'generating': '🤖 KI erstellt deinen personalisierten Plan...',
-        'success': '✅ Plan erstellt!',
-        'copy_btn': '📋 In Zwischenablage kopieren',
-        'prompt_template': """Ich habe heute {hours} Stunden verfügbar ({date}).
+def generate_response(messages: list, config: AIConfig) -> str:
+    """Get AI response, reusing the cached answer for identical requests."""
+    # Per-session cache first: reruns never re-hit the API for the same prompt
+    session_cache = st.session_state.groq_response_cache
+    key = make_cache_key(config, messages)
+    if key in session_cache:
+        return session_cache[key]
+    
+    content = get_cached_response(config, messages)
+    if content is None:
+        content = call_groq(messages, config)
+        put_cached_response(config, messages, content)
+    
+    session_cache[key] = content
+    if len(session_cache) > SESSION_CACHE_SIZE:
+        del session_cache[next(iter(session_cache))]  # FIFO eviction
+    
+    return content
 
-Meine Schwerpunkte: {focus}
-Bevorzugte Zeitblöcke: {blocks} Minuten
 
-{context}
+def call_groq(messages: list, config: AIConfig) -> str:
+    """Call the Groq API and return the response content."""
+    client = get_groq_client()
+    response = client.chat.completions.create(
+        model=config.model,
+        messages=messages,
+        temperature=config.temperature,
+        max_tokens=config.max_tokens
+    )
+    
+    return response.choices[0].message.content
 
-Bitte erstelle einen realistischen, zeitlich strukturierten Plan für heute."""
-    },
-    'ar': {
-        'title': '📅 الخطة اليومية',
-        'select_date': 'اختر التاريخ:',
-        'available_hours': 'الساعات المتاحة:',
-        'plan_exists': '📋 الخطة موجودة بالفعل لـ',
-        'regenerate': '🔄 إعادة إنشاء الخطة',
-        'add_context': '➕ إضافة سياق إضافي (اختياري)',
-        'context_label': 'أي أولويات أو قيود محددة لهذا اليوم؟',
-        'context_placeholder': 'مثال: موعد طبيب الساعة 2 مساءً، يجب إنهاء المشروع X',
-        'generate_btn': '✨ إنشاء الخطة اليومية',
-        'generating': '🤖 الذكاء الاصطناعي يقوم بإنشاء خطتك المخصصة...',
-        'success': '✅ تم إنشاء الخطة!',
-        'copy_btn': '📋 نسخ إلى الحافظة',
-        'prompt_template': """لدي {hours} ساعات متاحة اليوم ({date}).
 
-مجالات التركيز: {focus}
-كتل الوقت المفضلة: {blocks} دقيقة
+# ============================================================================
+# CACHED DATA READS
+# ============================================================================
 
-{context}
+@st.cache_data(ttl=300, show_spinner=False)
+def load_daily_plan(user_id: int, date: str):
+    """Get a daily plan, cached across reruns."""
+    return get_daily_plan(user_id, date)
 
-يرجى إنشاء جدول واقعي ومنظم زمنياً لهذا اليوم."""
-    },
-    'fr': {
-        'title': '📅 Plan Quotidien',
-        'select_date': 'Sélectionner la date:',
-        'available_hours': 'Heures disponibles:',
-        'plan_exists': '📋 Le plan existe déjà pour',
-        'regenerate': '🔄 Régénérer le plan',
-        'add_context': '➕ Ajouter un contexte supplémentaire (Optionnel)',
-        'context_label': 'Des priorités ou contraintes spécifiques pour aujourd\'hui?',
-        'context_placeholder': 'ex: Rendez-vous médecin à 14h, besoin de finir projet X',
-        'generate_btn': '✨ Générer le plan quotidien',
-        'generating': '🤖 L\'IA crée votre plan personnalisé...',
-        'success': '✅ Plan généré!',
-        'copy_btn': '📋 Copier dans le presse-papiers',
-        'prompt_template': """J'ai {hours} heures disponibles aujourd'hui ({date}).
 
-Mes domaines prioritaires: {focus}
-Blocs de temps préférés: {blocks} minutes
+@st.cache_data(ttl=300, show_spinner=False)
+def load_recent_daily_plans(user_id: int, limit: int = 7):
+    """Get recent daily plan summaries, cached across reruns."""
+    return get_recent_daily_plan_summaries(user_id, limit=limit)
 
-{context}
 
-Veuillez créer un emploi du temps réaliste et structuré pour aujourd'hui."""
-    }
-}
+@st.cache_data(ttl=5, show_spinner=False)
+def load_database_stats():
+    """Get database statistics, cached briefly across reruns."""
+    return get_database_stats()
 
-WEEKLY_REVIEW_STRINGS = {
-    'en': {
-        'title': '📊 Weekly Review',
-        'week_info': '📅 Reviewing week:',
-        'no_plans': '⚠️ No daily plans found for this week. Create some plans first!',
-        'plans_summary': '📋 This Week\'s Plans',
-        'reflections_title': '💭 Your Reflections (Optional)',
-        'reflections_label': 'How did this week go? Any wins or challenges?',
-        'reflections_placeholder': 'e.g., Completed Quran goal 3 days, struggled with morning routine',
-        'generate_btn': '✨ Generate Weekly Review',
-        'generating': '🤖 AI is analyzing your week...',
-        'success': '✅ Review generated!',
-    },
-    'de': {
-        'title': '📊 Wochenrückblick',
-        'week_info': '📅 Woche im Rückblick:',
-        'no_plans': '⚠️ Keine Tagespläne für diese Woche gefunden. Erstelle zuerst einige Pläne!',
-        'plans_summary': '📋 Pläne dieser Woche',
-        'reflections_title': '💭 Deine Reflexionen (Optional)',
-        'reflections_label': 'Wie lief diese Woche? Erfolge oder Herausforderungen?',
-        'reflections_placeholder': 'z.B. Quran-Ziel an 3 Tagen erreicht, Probleme mit Morgenroutine',
-        'generate_btn': '✨ Wochenrückblick erstellen',
-        'generating': '🤖 KI analysiert deine Woche...',
-        'success': '✅ Rückblick erstellt!',
-    },
-    'ar': {
-        'title': '📊 المراجعة الأسبوعية',
-        'week_info': '📅 مراجعة الأسبوع:',
-        'no_plans': '⚠️ لم يتم العثور على خطط يومية لهذا الأسبوع. قم بإنشاء بعض الخطط أولاً!',
-        'plans_summary': '📋 خطط هذا الأسبوع',
-        'reflections_title': '💭 تأملاتك (اختياري)',
-        'reflections_label': 'كيف سار هذا الأسبوع؟ أي انتصارات أو تحديات؟',
-        'reflections_placeholder': 'مثال: أكملت هدف القرآن 3 أيام، واجهت صعوبة مع روتين الصباح',
-        'generate_btn': '✨ إنشاء المراجعة الأسبوعية',
-        'generating': '🤖 الذكاء الاصطناعي يحلل أسبوعك...',
-        'success': '✅ تم إنشاء المراجعة!',
-    },
-    'fr': {
-        'title': '📊 Revue Hebdomadaire',
-        'week_info': '📅 Révision de la semaine:',
-        'no_plans': '⚠️ Aucun plan quotidien trouvé pour cette semaine. Créez d\'abord quelques plans!',
-        'plans_summary': '📋 Plans de Cette Semaine',
-        'reflections_title': '💭 Vos Réflexions (Optionnel)',
-        'reflections_label': 'Comment s\'est passée cette semaine? Des victoires ou défis?',
-        'reflections_placeholder': 'ex: Objectif Coran complété 3 jours, difficulté avec routine matinale',
-        'generate_btn': '✨ Générer la Revue Hebdomadaire',
-        'generating': '🤖 L\'IA analyse votre semaine...',
-        'success': '✅ Revue générée!',
-    }
-}
 
-SETTINGS_STRINGS = {
-    'en': {
-        'title': '⚙️ Settings',
-        'profile_title': '👤 Your Profile',
-        'language': '**Language:**',
-        'coaching_tone': '**Coaching Tone:**',
-        'time_block': '**Time Block Size:**',
-        'focus_areas': '**Focus Areas:**',
-        'onboarding_title': '📋 Onboarding Answers',
-        'stats_title': '📊 Statistics',
-        'daily_plans': 'Daily Plans',
-        'weekly_reviews': 'Weekly Reviews',
-        'db_size': 'Database Size',
-        'actions_title': '🔧 Actions',
-        'redo_onboarding': '🔄 Redo Onboarding',
-        'reset_data': '🗑️ Reset All Data',
-        'reset_confirm': '⚠️ I understand this will delete all data',
-        'reset_success': '✅ Database reset! Refresh the page.',
-    },
-    'de': {
-        'title': '⚙️ Einstellungen',
-        'profile_title': '👤 Dein Profil',
-        'language': '**Sprache:**',
-        'coaching_tone': '**Coaching-Ton:**',
-        'time_block': '**Zeitblockgröße:**',
-        'focus_areas': '**Schwerpunkte:**',
-        'onboarding_title': '📋 Onboarding-Antworten',
-        'stats_title': '📊 Statistiken',
-        'daily_plans': 'Tagespläne',
-        'weekly_reviews': 'Wochenrückblicke',
-        'db_size': 'Datenbankgröße',
-        'actions_title': '🔧 Aktionen',
-        'redo_onboarding': '🔄 Onboarding wiederholen',
-        'reset_data': '🗑️ Alle Daten zurücksetzen',
-        'reset_confirm': '⚠️ Ich verstehe, dass dies alle Daten löscht',
-        'reset_success': '✅ Datenbank zurückgesetzt! Seite aktualisieren.',
-    },
-    'ar': {
-        'title': '⚙️ الإعدادات',
-        'profile_title': '👤 ملفك الشخصي',
-        'language': '**اللغة:**',
-        'coaching_tone': '**نبرة التدريب:**',
-        'time_block': '**حجم كتلة الوقت:**',
-        'focus_areas': '**مجالات التركيز:**',
-        'onboarding_title': '📋 إجابات التسجيل',
-        'stats_title': '📊 الإحصائيات',
-        'daily_plans': 'الخطط اليومية',
-        'weekly_reviews': 'المراجعات الأسبوعية',
-        'db_size': 'حجم قاعدة البيانات',
-        'actions_title': '🔧 الإجراءات',
-        'redo_onboarding': '🔄 إعادة التسجيل',
-        'reset_data': '🗑️ إعادة تعيين جميع البيانات',
-        'reset_confirm': '⚠️ أفهم أن هذا سيحذف جميع البيانات',
-        'reset_success': '✅ تم إعادة تعيين قاعدة البيانات! قم بتحديث الصفحة.',
-    },
-    'fr': {
-        'title': '⚙️ Paramètres',
-        'profile_title': '👤 Votre Profil',
-        'language': '**Langue:**',
-        'coaching_tone': '**Ton du Coaching:**',
-        'time_block': '**Taille du Bloc de Temps:**',
-        'focus_areas': '**Domaines de Focus:**',
-        'onboarding_title': '📋 Réponses d\'Intégration',
-        'stats_title': '📊 Statistiques',
-        'daily_plans': 'Plans Quotidiens',
-        'weekly_reviews': 'Revues Hebdomadaires',
-        'db_size': 'Taille de la Base de Données',
-        'actions_title': '🔧 Actions',
-        'redo_onboarding': '🔄 Refaire l\'Intégration',
-        'reset_data': '🗑️ Réinitialiser Toutes les Données',
-        'reset_confirm': '⚠️ Je comprends que cela supprimera toutes les données',
-        'reset_success': '✅ Base de données réinitialisée! Actualisez la page.',
-    }
-}
-
-
-# ============================================================================
-# HELPER FUNCTIONS
-# ============================================================================
-
-def get_strings(lang_code: str, category: str) -> dict:
-    """Get UI strings for a specific language and category."""
-    string_maps = {
-        'onboarding': UI_STRINGS,
-        'daily_planning': DAILY_PLANNING_STRINGS,
-        'weekly_review': WEEKLY_REVIEW_STRINGS,
-        'settings': SETTINGS_STRINGS
-    }
-    
-    strings = string_maps.get(category, UI_STRINGS)
-    return strings.get(lang_code, strings['en'])
+def clear_data_cache():
+    """Drop cached database reads after a write."""
+    load_daily_plan.clear()
+    load_recent_daily_plans.clear()
+    load_database_stats.clear()
 
 
 # ============================================================================
@@ -485,30 +207,36 @@ def get_strings(lang_code: str, category: str) -> dict:
 
 def show_onboarding():
     """Display onboarding flow."""
+    # Bind hot Streamlit callables once per render
+    markdown = st.markdown
+    selectbox = st.selectbox
+    
     # Default to English for onboarding start
     lang_code = st.session_state.get('language', 'en')
     s = get_strings(lang_code, 'onboarding')
     
     st.title(s['welcome_title'])
-    st.markdown("---")
     
-    st.markdown(f"""
+    # Collect answers
+    answers = {}
+    
+    # Welcome text and Question 1 title: one markdown block, separators included
+    markdown(f"""
+    ---
+    
     ### {s['welcome_subtitle']}
     
     {s['welcome_description']}
-    """)
     
-    st.markdown("---")
+    ---
     
-    # Collect answers
-    answers = {}
+    ### {s['q1_title']}
+    """)
     
     # Question 1: Language (most important)
-    st.subheader(s['q1_title'])
-    language_options = [lang["name"] for lang in LANGUAGES.values()]
-    answers['language'] = st.selectbox(
+    answers['language'] = selectbox(
         s['q1_label'],
-        options=language_options,
+        options=LANGUAGE_OPTIONS,
         key="q_language"
     )
     
@@ -517,117 +245,70 @@ def show_onboarding():
     st.session_state.language = lang_code
     s = get_strings(lang_code, 'onboarding')  # Update strings
     
-    st.markdown("---")
-    
     # Question 2: Role
-    st.subheader(s['q2_title'])
-    answers['role'] = st.selectbox(
+    markdown(f"---\n\n### {s['q2_title']}")
+    answers['role'] = selectbox(
         s['q2_label'],
-        options=[
-            "Parent with young children",
-            "Student",
-            "Working professional",
-            "Entrepreneur",
-            "Homemaker",
-            "Other"
-        ],
+        options=get_question_options("role"),
         key="q_role"
     )
     
-    st.markdown("---")
-    
     # Question 3: Goals (multiselect)
-    st.subheader(s['q3_title'])
+    markdown(f"---\n\n### {s['q3_title']}")
     answers['goals'] = st.multiselect(
         s['q3_label'],
-        options=[
-            "Quran memorization/study",
-            "Islamic knowledge",
-            "Career development",
-            "Family time",
-            "Personal projects",
-            "Health & fitness",
-            "Financial goals"
-        ],
+        options=get_question_options("goals"),
         key="q_goals"
     )
     
-    st.markdown("---")
-    
     # Question 4: Available Time
-    st.subheader(s['q4_title'])
-    answers['available_time'] = st.selectbox(
+    markdown(f"---\n\n### {s['q4_title']}")
+    answers['available_time'] = selectbox(
         s['q4_label'],
-        options=[
-            "Less than 1 hour",
-            "1-2 hours",
-            "2-4 hours",
-            "4+ hours",
-            "Varies greatly"
-        ],
+        options=get_question_options("available_time"),
         key="q_time"
     )
     
-    st.markdown("---")
-    
     # Question 5: Challenges
-    st.subheader(s['q5_title'])
-    answers['challenges'] = st.selectbox(
+    markdown(f"---\n\n### {s['q5_title']}")
+    answers['challenges'] = selectbox(
         s['q5_label'],
-        options=[
-            "Finding time with kids",
-            "Staying consistent",
-            "Prioritizing tasks",
-            "Avoiding distractions",
-            "Balancing multiple roles",
-            "Morning routine",
-            "Evening routine"
-        ],
+        options=get_question_options("challenges"),
         key="q_challenge"
     )
     
-    st.markdown("---")
-    
     # Question 6: Islamic Practice (optional)
-    st.subheader(s['q6_title'])
-    answers['islamic_practice'] = st.selectbox(
+    markdown(f"---\n\n### {s['q6_title']}")
+    answers['islamic_practice'] = selectbox(
         s['q6_label'],
-        options=[
-            "Beginner - learning the basics",
-            "Practicing - working on consistency",
-            "Committed - established routine",
-            "Prefer not to say"
-        ],
+        options=get_question_options("islamic_practice"),
         key="q_islamic"
     )
     
-    st.markdown("---")
-    
     # Question 7: Motivation Style
-    st.subheader(s['q7_title'])
-    answers['motivation_style'] = st.selectbox(
+    markdown(f"---\n\n### {s['q7_title']}")
+    answers['motivation_style'] = selectbox(
         s['q7_label'],
-        options=[
-            "Spiritual reminders (Quran, Hadith)",
-            "Practical tips and strategies",
-            "Success stories",
-            "Accountability and tracking",
-            "Mix of everything"
-        ],
+        options=get_question_options("motivation_style"),
         key="q_motivation"
     )
     
-    st.markdown("---")
+    markdown("---")
     
     # Submit button
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        if st.button(s['submit_btn'], type="primary", use_container_width=True):
+        # Goals are required: keep submit disabled until at least one is picked
+        if st.button(s['submit_btn'], type="primary", use_container_width=True,
+                     disabled=not answers['goals']):
             # Validate required fields
             if not answers.get('goals'):
                 st.error(s['error_goals'])
                 return
             
+            # Deferred: pulls in the Groq SDK, only needed on submit
+            from onboarding import generate_user_profile, validate_profile
+            
             # Generate profile
             with st.spinner(s['generating']):
                 profile = generate_user_profile(answers)
@@ -636,6 +317,7 @@ def show_onboarding():
                 if validate_profile(profile):
                     # Save to database
                     user_id = save_user_profile(profile)
+                    clear_data_cache()
                     profile['db_id'] = user_id
                     
                     # Update session state
@@ -647,10 +329,10 @@ def show_onboarding():
                     
                     # Show preview
                     with st.expander(s['preview_title']):
-                        st.markdown(f"{s['preview_tone']} {profile.get('coaching_tone')}")
-                        st.markdown(f"{s['preview_focus']} {', '.join(profile.get('key_focus_areas', []))}")
-                        st.markdown(f"{s['preview_timeblock']} {profile.get('time_block_size')} minutes")
-                        st.markdown(f"{s['preview_language']} {profile.get('language_code')}")
+                        markdown(f"{s['preview_tone']} {profile.get('coaching_tone')}")
+                        markdown(f"{s['preview_focus']} {', '.join(profile.get('key_focus_areas', []))}")
+                        markdown(f"{s['preview_timeblock']} {profile.get('time_block_size')} minutes")
+                        markdown(f"{s['preview_language']} {profile.get('language_code')}")
                     
                     st.rerun()
                 else:
@@ -663,12 +345,17 @@ def show_onboarding():
 
 def show_daily_planning():
     """Display daily planning interface."""
-    profile = st.session_state.user_profile
+    # Bind hot Streamlit callables once per render
+    markdown = st.markdown
+    button = st.button
+    ss = st.session_state
+    
+    profile = ss.user_profile
     lang_code = profile.get('language_code', 'en')
     s = get_strings(lang_code, 'daily_planning')
     
     st.title(s['title'])
-    st.markdown("---")
+    markdown("---")
     
     # Date selection
     col1, col2 = st.columns([2, 1])
@@ -689,36 +376,38 @@ def show_daily_planning():
             key="available_hours"
         )
     
-    st.markdown("---")
+    markdown("---")
     
     # Check if plan exists for this date
     date_str = selected_date.isoformat()
-    existing_plan = get_daily_plan(profile['db_id'], date_str)
+    existing_plan = load_daily_plan(profile['db_id'], date_str)
     
     if existing_plan:
         st.info(f"{s['plan_exists']} {date_str}")
         
         # Display plan in a nice container
-        st.markdown('<div class="plan-content">', unsafe_allow_html=True)
-        st.markdown(existing_plan['plan_content'])
-        st.markdown('</div>', unsafe_allow_html=True)
+        markdown('<div class="plan-content">', unsafe_allow_html=True)
+        markdown(existing_plan['plan_content'])
+        markdown('</div>', unsafe_allow_html=True)
+        
+        show_code = ss.get('show_plan_code', False)
         
         # Regenerate button
         col1, col2 = st.columns([1, 1])
         with col1:
-            if st.button(s['regenerate'], use_container_width=True):
+            if button(s['regenerate'], use_container_width=True):
                 # Delete existing plan and regenerate
                 existing_plan = None
                 st.rerun()
         
         with col2:
             # Copy button (shows code view)
-            if st.button(s['copy_btn'], use_container_width=True):
-                st.session_state.show_plan_code = not st.session_state.get('show_plan_code', False)
+            if button(s['copy_btn'], use_container_width=True):
+                ss['show_plan_code'] = not show_code
                 st.rerun()
         
         # Show copyable text if requested
-        if st.session_state.get('show_plan_code', False):
+        if show_code:
             st.code(existing_plan['plan_content'], language=None)
     
     if not existing_plan:
@@ -731,42 +420,35 @@ def show_daily_planning():
             )
         
         # Generate plan button
-        if st.button(s['generate_btn'], type="primary", use_container_width=True):
+        if button(s['generate_btn'], type="primary", use_container_width=True):
             with st.spinner(s['generating']):
                 # Build prompt
                 focus_areas = profile.get('key_focus_areas', [])
                 time_block = profile.get('time_block_size', 30)
                 
-                context_text = f"\nZusätzlicher Kontext: {additional_context}" if additional_context else ""
+                context_text = f"\n{s['context_prefix']} {additional_context}" if additional_context else ""
                 
-                user_input = s['prompt_template'].format(
-                    hours=available_hours,
-                    date=date_str,
-                    focus=', '.join(focus_areas),
-                    blocks=time_block,
-                    context=context_text
-                )
+                user_input = s['prompt_template'].format_map({
+                    'hours': available_hours,
+                    'date': date_str,
+                    'focus': ', '.join(focus_areas),
+                    'blocks': time_block,
+                    'context': context_text
+                })
+                
+                # Get AI config (resolved once, shared with create_messages)
+                config = get_ai_config("daily_planning", profile)
                 
                 # Create messages
                 messages = create_messages(
                     feature="daily_planning",
                     user_input=user_input,
-                    user_profile=profile
-                )
-                
-                # Get AI config
-                config = get_ai_config("daily_planning", profile)
-                
-                # Call AI
-                client = get_groq_client()
-                response = client.chat.completions.create(
-                    model=config['model'],
-                    messages=messages,
-                    temperature=config['temperature'],
-                    max_tokens=config['max_tokens']
+                    user_profile=profile,
+                    config=config
                 )
                 
-                plan_content = response.choices[0].message.content
+                # Call AI (or reuse cached response)
+                plan_content = generate_response(messages, config)
                 
                 # Save to database
                 save_daily_plan(
@@ -775,6 +457,7 @@ def show_daily_planning():
                     plan_content=plan_content,
                     available_hours=available_hours
                 )
+                clear_data_cache()
                 
                 st.success(s['success'])
                 st.rerun()  # Reload to show the plan
@@ -784,14 +467,26 @@ def show_daily_planning():
 # WEEKLY REVIEW PAGE
 # ============================================================================
 
+WEEKLY_REVIEW_REQUEST = """
+
+Please provide:
+1. Celebration of wins (even small ones)
+2. Patterns you notice
+3. 2-3 specific suggestions for next week
+4. Encouragement and motivation"""
+
+
 def show_weekly_review():
     """Display weekly review interface."""
+    # Bind hot Streamlit callables once per render
+    markdown = st.markdown
+    
     profile = st.session_state.user_profile
     lang_code = profile.get('language_code', 'en')
     s = get_strings(lang_code, 'weekly_review')
     
     st.title(s['title'])
-    st.markdown("---")
+    markdown("---")
     
     # Week selection
     today = datetime.now().date()
@@ -801,18 +496,21 @@ def show_weekly_review():
     st.info(f"{s['week_info']} {week_start} to {week_end}")
     
     # Get recent plans
-    recent_plans = get_recent_daily_plans(profile['db_id'], limit=7)
+    recent_plans = load_recent_daily_plans(profile['db_id'], limit=7)
     
     if not recent_plans:
         st.warning(s['no_plans'])
         return
     
+    # 300-char previews from the database; the summary trims them further
+    excerpts = [plan['preview'] for plan in recent_plans]
+    
     # Display plans summary
     with st.expander(s['plans_summary']):
-        for plan in recent_plans:
-            st.markdown(f"**{plan['date']}** ({plan['available_hours']}h)")
-            st.markdown(plan['plan_content'][:200] + "...")
-            st.markdown("---")
+        for plan, excerpt in zip(recent_plans, excerpts):
+            markdown(f"**{plan['date']}** ({plan['available_hours']}h)")
+            markdown(excerpt[:200] + "...")
+            markdown("---")
     
     # Review input
     st.subheader(s['reflections_title'])
@@ -825,44 +523,32 @@ def show_weekly_review():
     # Generate review button
     if st.button(s['generate_btn'], type="primary", use_container_width=True):
         with st.spinner(s['generating']):
-            # Build prompt
-            plans_summary = "\n\n".join([
-                f"**{p['date']}**: {p['plan_content'][:300]}"
-                for p in recent_plans
-            ])
+            # Build prompt in a single buffer
+            buf = io.StringIO()
+            buf.write("Here are my daily plans from this week:\n\n")
+            for i, (p, excerpt) in enumerate(zip(recent_plans, excerpts)):
+                if i:
+                    buf.write("\n\n")
+                buf.write(f"**{p['date']}**: {excerpt}")
+            buf.write("\n\n")
+            if user_reflections:
+                buf.write(f"My reflections: {user_reflections}")
+            buf.write(WEEKLY_REVIEW_REQUEST)
+            user_input = buf.getvalue()
             
-            user_input = f"""Here are my daily plans from this week:
-
-{plans_summary}
-
-{f"My reflections: {user_reflections}" if user_reflections else ""}
-
-Please provide:
-1. Celebration of wins (even small ones)
-2. Patterns you notice
-3. 2-3 specific suggestions for next week
-4. Encouragement and motivation"""
+            # Get AI config (resolved once, shared with create_messages)
+            config = get_ai_config("weekly_review", profile)
             
             # Create messages
             messages = create_messages(
                 feature="weekly_review",
                 user_input=user_input,
-                user_profile=profile
-            )
-            
-            # Get AI config
-            config = get_ai_config("weekly_review", profile)
-            
-            # Call AI
-            client = get_groq_client()
-            response = client.chat.completions.create(
-                model=config['model'],
-                messages=messages,
-                temperature=config['temperature'],
-                max_tokens=config['max_tokens']
+                user_profile=profile,
+                config=config
             )
             
-            review_content = response.choices[0].message.content
+            # Call AI (or reuse cached response)
+            review_content = generate_response(messages, config)
             
             # Save to database
             save_weekly_review(
@@ -871,10 +557,11 @@ Please provide:
                 week_end=week_end.isoformat(),
                 review_content=review_content
             )
+            load_database_stats.clear()
             
             st.success(s['success'])
-            st.markdown("---")
-            st.markdown(review_content)
+            markdown("---")
+            markdown(review_content)
 
 
 # ============================================================================
@@ -918,7 +605,7 @@ def show_settings():
     
     # Database stats
     st.subheader(s['stats_title'])
-    stats = get_database_stats()
+    stats = load_database_stats()
     
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -945,6 +632,9 @@ def show_settings():
         if st.button(s['reset_data'], use_container_width=True):
             if st.checkbox(s['reset_confirm']):
                 reset_database()
+                clear_memory_cache()
+                clear_data_cache()
+                st.session_state.groq_response_cache.clear()
                 st.session_state.onboarding_complete = False
                 st.session_state.user_profile = None
                 st.success(s['reset_success'])
@@ -965,74 +655,30 @@ def show_sidebar():
         if st.session_state.onboarding_complete:
             profile = st.session_state.user_profile
             lang_code = profile.get('language_code', 'en')
+            sb = get_strings(lang_code, 'sidebar')
             
             # Welcome message
-            welcome_messages = {
-                'en': '👋 Welcome back!',
-                'de': '👋 Willkommen zurück!',
-                'ar': '👋 مرحباً بعودتك!',
-                'fr': '👋 Bon retour!'
-            }
-            st.markdown(welcome_messages.get(lang_code, welcome_messages['en']))
+            st.markdown(sb['welcome'])
             st.markdown(f"🌍 Language: {lang_code.upper()}")
             st.markdown("---")
             
             # Menu
-            menu_options = {
-                'en': {
-                    "📅 Daily Planning": "daily_planning",
-                    "📊 Weekly Review": "weekly_review",
-                    "⚙️ Settings": "settings"
-                },
-                'de': {
-                    "📅 Tagesplanung": "daily_planning",
-                    "📊 Wochenrückblick": "weekly_review",
-                    "⚙️ Einstellungen": "settings"
-                },
-                'ar': {
-                    "📅 التخطيط اليومي": "daily_planning",
-                    "📊 المراجعة الأسبوعية": "weekly_review",
-                    "⚙️ الإعدادات": "settings"
-                },
-                'fr': {
-                    "📅 Planification Quotidienne": "daily_planning",
-                    "📊 Revue Hebdomadaire": "weekly_review",
-                    "⚙️ Paramètres": "settings"
-                }
-            }
-            
-            menu = menu_options.get(lang_code, menu_options['en'])
-            
-            for label, page in menu.items():
-                if st.button(label, use_container_width=True):
+            for page in ("daily_planning", "weekly_review", "settings"):
+                if st.button(sb['menu_' + page], use_container_width=True):
                     st.session_state.current_page = page
                     st.rerun()
             
             st.markdown("---")
             
             # Quick stats
-            stats = get_database_stats()
-            stats_labels = {
-                'en': {'plans': 'Plans:', 'reviews': 'Reviews:'},
-                'de': {'plans': 'Pläne:', 'reviews': 'Rückblicke:'},
-                'ar': {'plans': 'الخطط:', 'reviews': 'المراجعات:'},
-                'fr': {'plans': 'Plans:', 'reviews': 'Revues:'}
-            }
-            labels = stats_labels.get(lang_code, stats_labels['en'])
-            
+            stats = load_database_stats()
             st.markdown("### 📈 Quick Stats")
-            st.markdown(f"{labels['plans']} {stats['total_daily_plans']}")
-            st.markdown(f"{labels['reviews']} {stats['total_weekly_reviews']}")
+            st.markdown(f"{sb['stats_plans']} {stats['total_daily_plans']}")
+            st.markdown(f"{sb['stats_reviews']} {stats['total_weekly_reviews']}")
         
         else:
-            info_messages = {
-                'en': '👋 Complete onboarding to get started!',
-                'de': '👋 Schließe das Onboarding ab, um zu starten!',
-                'ar': '👋 أكمل التسجيل للبدء!',
-                'fr': '👋 Complétez l\'intégration pour commencer!'
-            }
             lang = st.session_state.get('language', 'en')
-            st.info(info_messages.get(lang, info_messages['en']))
+            st.info(get_strings(lang, 'sidebar')['onboarding_info'])
         
         st.markdown("---")
         st.markdown("Built with ❤️ by [Brain-Time](https://github.com/Brain-Time)")
@@ -1058,6 +704,10 @@ def main():
             st.session_state.user_profile = existing_profile
             st.session_state.onboarding_complete = True
     
+    # Warm the string cache for the user's language before rendering
+    if st.session_state.user_profile:
+        preload_language(st.session_state.user_profile.get('language_code', 'en'))
+    
     # Show sidebar
     show_sidebar()
     
@@ -0,0 +1,20 @@
+"""
+Shared pytest fixtures.
+
+Author: Brain-Time
+Project: Productivity Coach
+"""
+
+import pytest
+
+import database
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """Point the database module at a fresh, initialized database file."""
+    database.close_connection()
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "test.db")
+    database.init_database()
+    yield database
+    database.close_connection()
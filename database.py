@@ -9,11 +9,15 @@ Project: Productivity Coach
 """
 
 import sqlite3
-import json
-from typing import Dict, Optional, List
+import functools
+import os
+import threading
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 
 # ============================================================================
 # DATABASE CONFIGURATION
@@ -22,19 +26,90 @@ from pathlib import Path
 DB_PATH = Path("productivity_coach.db")
 DB_VERSION = 1
 
+# Timestamps are generated inside SQL as local ISO-8601 text, e.g.
+# strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime') -> 2024-12-16T09:30:00.123
+
+# Per-connection settings (journal_mode=WAL is persisted by init_database)
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",      # WAL: fsync at checkpoints, not per commit
+    "PRAGMA busy_timeout=5000",       # wait up to 5 s for a lock
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",     # 256 MB
+    "PRAGMA cache_size=-20000",       # ~20 MB page cache
+)
+
+# One connection for the whole process, reused across calls, sessions and
+# reruns (Streamlit runs every rerun in a new, short-lived thread, so a
+# per-thread connection would be reopened each time). _lock serializes its
+# use: statements and transactions from different threads never interleave.
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.RLock()
+
+# Tables cleared by reset_database (app_metadata keeps the schema version)
+DATA_TABLES = (
+    "weekly_reviews",
+    "daily_plans",
+    "user_profiles",
+    "response_cache",
+)
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Get the shared connection, opening it on first use (caller holds _lock)."""
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(
+            DB_PATH,
+            check_same_thread=False  # shared across threads, guarded by _lock
+        )
+        conn.row_factory = sqlite3.Row  # rows support row["column"] and dict(row)
+        if os.getenv("DB_TRACE") == "1":
+            conn.set_trace_callback(_trace_sql)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        _conn = conn
+    return _conn
+
+
+def _locked(func):
+    """Run a database operation while holding the connection lock."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _lock:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _trace_sql(statement: str) -> None:
+    """Print each executed statement (enabled with DB_TRACE=1)."""
+    print(f"🔎 SQL: {' '.join(statement.split())}")
+
+
+@_locked
+def close_connection() -> None:
+    """Close the shared connection (if open); the next call reopens it."""
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
 
 # ============================================================================
 # DATABASE INITIALIZATION
 # ============================================================================
 
+@_locked
 def init_database() -> None:
     """
     Initialize database with required tables.
     Creates tables if they don't exist.
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
+    # Write-ahead log: readers don't block the writer (persisted in the file)
+    cursor.execute("PRAGMA journal_mode=WAL")
+    
     # User Profiles Table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS user_profiles (
@@ -42,10 +117,45 @@ def init_database() -> None:
             profile_data TEXT NOT NULL,
             created_at TEXT NOT NULL,
             updated_at TEXT NOT NULL,
-            is_active INTEGER DEFAULT 1
+            is_active INTEGER DEFAULT 1,
+            language_code TEXT GENERATED ALWAYS AS (
+                json_extract(profile_data, '$.language_code')
+            ) VIRTUAL
         )
     """)
     
+    # Databases created before language_code existed get it added in place
+    columns = {row['name'] for row in cursor.execute("PRAGMA table_xinfo(user_profiles)")}
+    if 'language_code' not in columns:
+        cursor.execute("""
+            ALTER TABLE user_profiles
+            ADD COLUMN language_code TEXT GENERATED ALWAYS AS (
+                json_extract(profile_data, '$.language_code')
+            ) VIRTUAL
+        """)
+    
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_profiles_language
+        ON user_profiles (language_code)
+    """)
+    
+    # Superseded by idx_profiles_one_active below (dropped from older databases)
+    cursor.execute("DROP INDEX IF EXISTS idx_profiles_active")
+    
+    # At most one active profile (older databases: keep only the newest active).
+    # The partial index also serves active profile lookups and deactivation
+    cursor.execute("""
+        UPDATE user_profiles
+        SET is_active = 0
+        WHERE is_active = 1
+          AND id <> (SELECT MAX(id) FROM user_profiles WHERE is_active = 1)
+    """)
+    cursor.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_profiles_one_active
+        ON user_profiles (is_active)
+        WHERE is_active = 1
+    """)
+    
     # Daily Plans Table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS daily_plans (
@@ -72,6 +182,16 @@ def init_database() -> None:
         )
     """)
     
+    # Per-user lookups ordered by date / week (no full scan + sort)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_daily_plans_user_date
+        ON daily_plans (user_id, date DESC)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_weekly_reviews_user_week
+        ON weekly_reviews (user_id, week_start DESC)
+    """)
+    
     # App Metadata Table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS app_metadata (
@@ -81,14 +201,25 @@ def init_database() -> None:
         )
     """)
     
+    # AI Response Cache Table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS response_cache (
+            key BLOB PRIMARY KEY,
+            response TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+    
+    # Plan templates duplicated the response cache (dropped from older databases)
+    cursor.execute("DROP TABLE IF EXISTS plan_templates")
+    
     # Insert DB version
     cursor.execute("""
         INSERT OR REPLACE INTO app_metadata (key, value, updated_at)
-        VALUES ('db_version', ?, ?)
-    """, (str(DB_VERSION), datetime.now().isoformat()))
+        VALUES ('db_version', ?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
+    """, (str(DB_VERSION),))
     
     conn.commit()
-    conn.close()
     
     print(f"✅ Database initialized: {DB_PATH}")
 
@@ -97,6 +228,18 @@ def init_database() -> None:
 # USER PROFILE OPERATIONS
 # ============================================================================
 
+@functools.lru_cache(maxsize=32)
+def _parse_profile(profile_json: str) -> Dict:
+    """Parse stored profile JSON (memoized: profiles are re-read unchanged)."""
+    return orjson.loads(profile_json)
+
+
+def _load_profile(profile_json: str) -> Dict:
+    """Get a parsed profile; a shallow copy, so callers can add keys freely."""
+    return dict(_parse_profile(profile_json))
+
+
+@_locked
 def save_user_profile(profile_data: Dict) -> int:
     """
     Save user profile to database.
@@ -107,31 +250,35 @@ def save_user_profile(profile_data: Dict) -> int:
     Returns:
         User ID (primary key)
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
-    # Deactivate any existing active profiles
-    cursor.execute("""
-        UPDATE user_profiles 
-        SET is_active = 0 
-        WHERE is_active = 1
-    """)
-    
-    # Insert new profile
-    now = datetime.now().isoformat()
-    cursor.execute("""
-        INSERT INTO user_profiles (profile_data, created_at, updated_at, is_active)
-        VALUES (?, ?, ?, 1)
-    """, (json.dumps(profile_data), now, now))
+    profile_json = orjson.dumps(profile_data).decode()
     
-    user_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    # Deactivate + insert as one transaction, taking the write lock up front
+    with conn:
+        cursor.execute("BEGIN IMMEDIATE")
+        
+        # Deactivate any existing active profiles
+        cursor.execute("""
+            UPDATE user_profiles 
+            SET is_active = 0 
+            WHERE is_active = 1
+        """)
+        
+        # Insert new profile
+        cursor.execute("""
+            INSERT INTO user_profiles (profile_data, created_at, updated_at, is_active)
+            VALUES (?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'), strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'), 1)
+        """, (profile_json,))
+        
+        user_id = cursor.lastrowid
     
     print(f"✅ User profile saved with ID: {user_id}")
     return user_id
 
 
+@_locked
 def get_active_user_profile() -> Optional[Dict]:
     """
     Get the currently active user profile.
@@ -139,7 +286,7 @@ def get_active_user_profile() -> Optional[Dict]:
     Returns:
         User profile dict or None if no active profile
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
     cursor.execute("""
@@ -151,18 +298,18 @@ def get_active_user_profile() -> Optional[Dict]:
     """)
     
     row = cursor.fetchone()
-    conn.close()
     
     if row:
-        profile = json.loads(row[1])
-        profile['db_id'] = row[0]
-        profile['db_created_at'] = row[2]
-        profile['db_updated_at'] = row[3]
+        profile = _load_profile(row['profile_data'])
+        profile['db_id'] = row['id']
+        profile['db_created_at'] = row['created_at']
+        profile['db_updated_at'] = row['updated_at']
         return profile
     
     return None
 
 
+@_locked
 def update_user_profile(user_id: int, profile_data: Dict) -> bool:
     """
     Update existing user profile.
@@ -174,19 +321,20 @@ def update_user_profile(user_id: int, profile_data: Dict) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
-    now = datetime.now().isoformat()
-    cursor.execute("""
-        UPDATE user_profiles
-        SET profile_data = ?, updated_at = ?
-        WHERE id = ?
-    """, (json.dumps(profile_data), now, user_id))
+    profile_json = orjson.dumps(profile_data).decode()
     
-    success = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
+    with conn:
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("""
+            UPDATE user_profiles
+            SET profile_data = ?, updated_at = strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')
+            WHERE id = ?
+        """, (profile_json, user_id))
+        
+        success = cursor.rowcount > 0
     
     if success:
         print(f"✅ User profile {user_id} updated")
@@ -196,6 +344,7 @@ def update_user_profile(user_id: int, profile_data: Dict) -> bool:
     return success
 
 
+@_locked
 def get_all_user_profiles() -> List[Dict]:
     """
     Get all user profiles (for admin/debugging).
@@ -203,7 +352,7 @@ def get_all_user_profiles() -> List[Dict]:
     Returns:
         List of user profile dicts
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
     cursor.execute("""
@@ -213,15 +362,14 @@ def get_all_user_profiles() -> List[Dict]:
     """)
     
     profiles = []
-    for row in cursor.fetchall():
-        profile = json.loads(row[1])
-        profile['db_id'] = row[0]
-        profile['db_created_at'] = row[2]
-        profile['db_updated_at'] = row[3]
-        profile['is_active'] = bool(row[4])
+    for row in cursor:
+        profile = _load_profile(row['profile_data'])
+        profile['db_id'] = row['id']
+        profile['db_created_at'] = row['created_at']
+        profile['db_updated_at'] = row['updated_at']
+        profile['is_active'] = bool(row['is_active'])
         profiles.append(profile)
     
-    conn.close()
     return profiles
 
 
@@ -229,6 +377,7 @@ def get_all_user_profiles() -> List[Dict]:
 # DAILY PLAN OPERATIONS
 # ============================================================================
 
+@_locked
 def save_daily_plan(user_id: int, date: str, plan_content: str, 
                    available_hours: float) -> int:
     """
@@ -243,23 +392,49 @@ def save_daily_plan(user_id: int, date: str, plan_content: str,
     Returns:
         Plan ID
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
-    now = datetime.now().isoformat()
     cursor.execute("""
         INSERT INTO daily_plans (user_id, date, plan_content, available_hours, created_at)
-        VALUES (?, ?, ?, ?, ?)
-    """, (user_id, date, plan_content, available_hours, now))
+        VALUES (?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
+    """, (user_id, date, plan_content, available_hours))
     
     plan_id = cursor.lastrowid
     conn.commit()
-    conn.close()
     
     print(f"✅ Daily plan saved with ID: {plan_id}")
     return plan_id
 
 
+@_locked
+def save_daily_plans_bulk(plans: List[Tuple[int, str, str, float]]) -> int:
+    """
+    Save many daily plans in a single transaction (e.g. for imports).
+    
+    Args:
+        plans: (user_id, date, plan_content, available_hours) tuples
+        
+    Returns:
+        Number of plans saved
+    """
+    conn = _get_conn()
+    cursor = conn.cursor()
+    
+    # One transaction (and one WAL sync) for all rows
+    with conn:
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany("""
+            INSERT INTO daily_plans (user_id, date, plan_content, available_hours, created_at)
+            VALUES (?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
+        """, plans)
+        count = cursor.rowcount
+    
+    print(f"✅ {count} daily plans saved")
+    return count
+
+
+@_locked
 def get_daily_plan(user_id: int, date: str) -> Optional[Dict]:
     """
     Get daily plan for a specific date.
@@ -271,11 +446,11 @@ def get_daily_plan(user_id: int, date: str) -> Optional[Dict]:
     Returns:
         Plan dict or None
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
     cursor.execute("""
-        SELECT id, plan_content, available_hours, created_at
+        SELECT id, plan_content, available_hours, created_at, date
         FROM daily_plans
         WHERE user_id = ? AND date = ?
         ORDER BY created_at DESC
@@ -283,20 +458,11 @@ def get_daily_plan(user_id: int, date: str) -> Optional[Dict]:
     """, (user_id, date))
     
     row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        return {
-            'id': row[0],
-            'plan_content': row[1],
-            'available_hours': row[2],
-            'created_at': row[3],
-            'date': date
-        }
     
-    return None
+    return dict(row) if row else None
 
 
+@_locked
 def get_recent_daily_plans(user_id: int, limit: int = 7) -> List[Dict]:
     """
     Get recent daily plans.
@@ -308,7 +474,7 @@ def get_recent_daily_plans(user_id: int, limit: int = 7) -> List[Dict]:
     Returns:
         List of plan dicts
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
     cursor.execute("""
@@ -319,24 +485,43 @@ def get_recent_daily_plans(user_id: int, limit: int = 7) -> List[Dict]:
         LIMIT ?
     """, (user_id, limit))
     
-    plans = []
-    for row in cursor.fetchall():
-        plans.append({
-            'id': row[0],
-            'date': row[1],
-            'plan_content': row[2],
-            'available_hours': row[3],
-            'created_at': row[4]
-        })
+    return [dict(row) for row in cursor]
+
+
+@_locked
+def get_recent_daily_plan_summaries(user_id: int, limit: int = 7,
+                                    preview_chars: int = 300) -> List[Dict]:
+    """
+    Get recent daily plans with a short preview instead of the full content.
+    
+    Args:
+        user_id: User ID
+        limit: Number of plans to retrieve
+        preview_chars: Length of the plan preview
+        
+    Returns:
+        List of plan dicts ('preview' instead of 'plan_content')
+    """
+    conn = _get_conn()
+    cursor = conn.cursor()
     
-    conn.close()
-    return plans
+    cursor.execute("""
+        SELECT id, date, available_hours, created_at,
+               substr(plan_content, 1, ?) AS preview
+        FROM daily_plans
+        WHERE user_id = ?
+        ORDER BY date DESC
+        LIMIT ?
+    """, (preview_chars, user_id, limit))
+    
+    return [dict(row) for row in cursor]
 
 
 # ============================================================================
 # WEEKLY REVIEW OPERATIONS
 # ============================================================================
 
+@_locked
 def save_weekly_review(user_id: int, week_start: str, week_end: str, 
                       review_content: str) -> int:
     """
@@ -351,23 +536,22 @@ def save_weekly_review(user_id: int, week_start: str, week_end: str,
     Returns:
         Review ID
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
-    now = datetime.now().isoformat()
     cursor.execute("""
         INSERT INTO weekly_reviews (user_id, week_start, week_end, review_content, created_at)
-        VALUES (?, ?, ?, ?, ?)
-    """, (user_id, week_start, week_end, review_content, now))
+        VALUES (?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
+    """, (user_id, week_start, week_end, review_content))
     
     review_id = cursor.lastrowid
     conn.commit()
-    conn.close()
     
     print(f"✅ Weekly review saved with ID: {review_id}")
     return review_id
 
 
+@_locked
 def get_weekly_review(user_id: int, week_start: str) -> Optional[Dict]:
     """
     Get weekly review for a specific week.
@@ -379,11 +563,11 @@ def get_weekly_review(user_id: int, week_start: str) -> Optional[Dict]:
     Returns:
         Review dict or None
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
     cursor.execute("""
-        SELECT id, week_end, review_content, created_at
+        SELECT id, week_start, week_end, review_content, created_at
         FROM weekly_reviews
         WHERE user_id = ? AND week_start = ?
         ORDER BY created_at DESC
@@ -391,20 +575,11 @@ def get_weekly_review(user_id: int, week_start: str) -> Optional[Dict]:
     """, (user_id, week_start))
     
     row = cursor.fetchone()
-    conn.close()
     
-    if row:
-        return {
-            'id': row[0],
-            'week_start': week_start,
-            'week_end': row[1],
-            'review_content': row[2],
-            'created_at': row[3]
-        }
-    
-    return None
+    return dict(row) if row else None
 
 
+@_locked
 def get_all_weekly_reviews(user_id: int) -> List[Dict]:
     """
     Get all weekly reviews for a user.
@@ -415,7 +590,7 @@ def get_all_weekly_reviews(user_id: int) -> List[Dict]:
     Returns:
         List of review dicts
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
     cursor.execute("""
@@ -425,37 +600,97 @@ def get_all_weekly_reviews(user_id: int) -> List[Dict]:
         ORDER BY week_start DESC
     """, (user_id,))
     
-    reviews = []
-    for row in cursor.fetchall():
-        reviews.append({
-            'id': row[0],
-            'week_start': row[1],
-            'week_end': row[2],
-            'review_content': row[3],
-            'created_at': row[4]
-        })
+    return [dict(row) for row in cursor]
+
+
+# ============================================================================
+# RESPONSE CACHE OPERATIONS
+# ============================================================================
+
+@_locked
+def save_response_cache_entry(key: bytes, response: str, max_entries: int) -> None:
+    """
+    Save an AI response to the response cache and drop the oldest entries.
+    
+    Args:
+        key: Cache key (hash of the request)
+        response: AI response content
+        max_entries: Entries beyond the newest max_entries are deleted
+    """
+    conn = _get_conn()
+    cursor = conn.cursor()
+    
+    cursor.execute("""
+        INSERT OR REPLACE INTO response_cache (key, response, created_at)
+        VALUES (?, ?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
+    """, (key, response))
+    
+    # INSERT OR REPLACE assigns a new rowid, so rowid order is insertion order
+    cursor.execute("""
+        DELETE FROM response_cache
+        WHERE rowid <= (
+            SELECT rowid FROM response_cache
+            ORDER BY rowid DESC
+            LIMIT 1 OFFSET ?
+        )
+    """, (max_entries,))
     
-    conn.close()
-    return reviews
+    conn.commit()
+
+
+@_locked
+def get_response_cache_entry(key: bytes) -> Optional[str]:
+    """
+    Get a cached AI response.
+    
+    Args:
+        key: Cache key (hash of the request)
+        
+    Returns:
+        Response content or None
+    """
+    conn = _get_conn()
+    cursor = conn.cursor()
+    
+    cursor.execute("""
+        SELECT response
+        FROM response_cache
+        WHERE key = ?
+    """, (key,))
+    
+    row = cursor.fetchone()
+    
+    return row['response'] if row else None
 
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+@_locked
 def reset_database() -> None:
     """
     Reset database (delete all data).
     USE WITH CAUTION!
     """
-    if DB_PATH.exists():
-        DB_PATH.unlink()
-        print("⚠️  Database deleted")
-    
-    init_database()
+    init_database()  # every table must exist before it can be cleared
+    
+    # Clear data in one transaction; connections (cached ones included) stay valid
+    conn = _get_conn()
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for table in DATA_TABLES:
+            conn.execute(f"DELETE FROM {table}")
+        conn.execute("DELETE FROM sqlite_sequence")  # restart ids at 1
+    print("⚠️  All data deleted")
+    
+    # Reclaim the freed pages (VACUUM can't run inside a transaction)
+    conn.execute("VACUUM")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")  # shrink the file now, not later
     print("✅ Database reset complete")
 
 
+@_locked
 def get_database_stats() -> Dict:
     """
     Get database statistics.
@@ -463,31 +698,33 @@ def get_database_stats() -> Dict:
     Returns:
         Dict with counts of various records
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
-    stats = {}
-    
-    # User profiles count
-    cursor.execute("SELECT COUNT(*) FROM user_profiles")
-    stats['total_profiles'] = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM user_profiles WHERE is_active = 1")
-    stats['active_profiles'] = cursor.fetchone()[0]
-    
-    # Daily plans count
-    cursor.execute("SELECT COUNT(*) FROM daily_plans")
-    stats['total_daily_plans'] = cursor.fetchone()[0]
-    
-    # Weekly reviews count
-    cursor.execute("SELECT COUNT(*) FROM weekly_reviews")
-    stats['total_weekly_reviews'] = cursor.fetchone()[0]
+    # All counts and the database size in a single query. The size comes from
+    # page_count * page_size: with WAL, recent writes are still in the -wal
+    # file, so the main file's size on disk lags behind the data
+    cursor.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM user_profiles),
+            (SELECT COUNT(*) FROM user_profiles WHERE is_active = 1),
+            (SELECT COUNT(*) FROM daily_plans),
+            (SELECT COUNT(*) FROM weekly_reviews),
+            (SELECT page_count FROM pragma_page_count())
+                * (SELECT page_size FROM pragma_page_size())
+    """)
     
-    # Database size
-    stats['db_size_bytes'] = DB_PATH.stat().st_size if DB_PATH.exists() else 0
-    stats['db_size_kb'] = round(stats['db_size_bytes'] / 1024, 2)
+    (total_profiles, active_profiles, total_daily_plans, total_weekly_reviews,
+     db_size_bytes) = cursor.fetchone()
+    stats = {
+        'total_profiles': total_profiles,
+        'active_profiles': active_profiles,
+        'total_daily_plans': total_daily_plans,
+        'total_weekly_reviews': total_weekly_reviews,
+        'db_size_bytes': db_size_bytes,
+        'db_size_kb': round(db_size_bytes / 1024, 2)
+    }
     
-    conn.close()
     return stats
 
 
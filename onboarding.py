@@ -9,19 +9,23 @@ Project: Productivity Coach
 
 from dotenv import load_dotenv
 import os
-from groq import Groq
 import json
-from typing import Dict, Optional
+import functools
+import re
+from typing import TYPE_CHECKING, Dict
 from datetime import datetime
 
 from ai_config import (
-    ONBOARDING_QUESTIONS,
     get_model,
     get_temperature,
     get_language_code,
-    get_language_instruction
+    get_language_instruction,
+    finalize_profile
 )
 
+if TYPE_CHECKING:
+    from groq import Groq
+
 load_dotenv()
 
 
@@ -29,8 +33,11 @@ load_dotenv()
 # GROQ CLIENT INITIALIZATION
 # ============================================================================
 
-def get_groq_client() -> Groq:
-    """Initialize and return Groq client."""
+@functools.lru_cache(maxsize=1)
+def get_groq_client() -> "Groq":
+    """Initialize and return Groq client (created once, then reused)."""
+    from groq import Groq  # Deferred: heavy import, only needed for API calls
+    
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         raise ValueError("GROQ_API_KEY not found in environment variables")
@@ -41,6 +48,10 @@ def get_groq_client() -> Groq:
 # PROFILE GENERATION
 # ============================================================================
 
+# Body of a ```json ... ``` fence (closing fence optional, any case)
+_FENCE_RE = re.compile(r"^```(?:json)?\s*(.*?)\s*(?:```|$)", re.DOTALL | re.IGNORECASE)
+
+
 def generate_user_profile(onboarding_data: Dict) -> Dict:
     """
     Generate personalized AI profile based on onboarding answers.
@@ -128,11 +139,9 @@ IMPORTANT:
         content = response.choices[0].message.content.strip()
         
         # Remove markdown code blocks if present
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-            content = content.strip()
+        match = _FENCE_RE.match(content)
+        if match:
+            content = match.group(1)
         
         # Parse JSON
         profile = json.loads(content)
@@ -142,7 +151,7 @@ IMPORTANT:
         profile["created_at"] = datetime.now().isoformat()
         profile["language_code"] = language_code
         
-        return profile
+        return finalize_profile(profile)
         
     except json.JSONDecodeError as e:
         print(f"⚠️  JSON parsing failed: {e}")
@@ -169,7 +178,7 @@ def get_default_profile(onboarding_data: Dict) -> Dict:
     role = onboarding_data.get('role', 'individual')
     goals = onboarding_data.get('goals', [])
     
-    return {
+    return finalize_profile({
         "system_message_daily_planning": f"""You are a productivity coach for a {role}.
         
 Focus on these goals: {', '.join(goals) if isinstance(goals, list) else goals}.
@@ -196,7 +205,7 @@ Provide:
         "created_at": datetime.now().isoformat(),
         "language_code": language_code,
         "is_default": True
-    }
+    })
 
 
 # ============================================================================
@@ -235,9 +244,13 @@ def validate_profile(profile: Dict) -> bool:
 # ============================================================================
 
 if __name__ == "__main__":
-    print("=" * 60)
-    print("ONBOARDING MODULE TEST")
-    print("=" * 60)
+    BANNER = "=" * 60
+    
+    def section(title: str, body: str = "") -> None:
+        """Print a banner-framed section header (and its body) in one write."""
+        print(f"\n{BANNER}\n{title}\n{BANNER}" + (f"\n{body}" if body else ""))
+    
+    print(f"{BANNER}\nONBOARDING MODULE TEST\n{BANNER}")
     
     # Test with realistic user data
     test_user_data = {
@@ -251,37 +264,28 @@ if __name__ == "__main__":
     }
     
     print("\n📝 Test User Data:")
-    for key, value in test_user_data.items():
-        print(f"   {key}: {value}")
+    print("\n".join(f"   {key}: {value}" for key, value in test_user_data.items()))
     
     print("\n🔄 Generating personalized profile...")
     profile = generate_user_profile(test_user_data)
     
-    print("\n✅ Profile Generated!\n")
-    print("=" * 60)
-    print("DAILY PLANNING SYSTEM MESSAGE:")
-    print("=" * 60)
-    print(profile.get("system_message_daily_planning", "N/A"))
+    print("\n✅ Profile Generated!")
+    section("DAILY PLANNING SYSTEM MESSAGE:",
+            profile.get("system_message_daily_planning", "N/A"))
     
-    print("\n" + "=" * 60)
-    print("WEEKLY REVIEW SYSTEM MESSAGE:")
-    print("=" * 60)
-    print(profile.get("system_message_weekly_review", "N/A"))
+    section("WEEKLY REVIEW SYSTEM MESSAGE:",
+            profile.get("system_message_weekly_review", "N/A"))
     
-    print("\n" + "=" * 60)
-    print("PROFILE DETAILS:")
-    print("=" * 60)
-    print(f"Coaching Tone: {profile.get('coaching_tone', 'N/A')}")
-    print(f"Focus Areas: {', '.join(profile.get('key_focus_areas', []))}")
-    print(f"Time Block Size: {profile.get('time_block_size', 'N/A')} minutes")
-    print(f"Islamic Emphasis: {profile.get('islamic_emphasis', 'N/A')}")
-    print(f"Language: {profile.get('language_code', 'N/A')}")
-    print(f"Is Default: {profile.get('is_default', False)}")
+    section("PROFILE DETAILS:", "\n".join([
+        f"Coaching Tone: {profile.get('coaching_tone', 'N/A')}",
+        f"Focus Areas: {', '.join(profile.get('key_focus_areas', []))}",
+        f"Time Block Size: {profile.get('time_block_size', 'N/A')} minutes",
+        f"Islamic Emphasis: {profile.get('islamic_emphasis', 'N/A')}",
+        f"Language: {profile.get('language_code', 'N/A')}",
+        f"Is Default: {profile.get('is_default', False)}"
+    ]))
     
-    print("\n" + "=" * 60)
-    print("VALIDATION:")
-    print("=" * 60)
     is_valid = validate_profile(profile)
-    print(f"Profile Valid: {'✅ Yes' if is_valid else '❌ No'}")
+    section("VALIDATION:", f"Profile Valid: {'✅ Yes' if is_valid else '❌ No'}")
     
     print("\n✅ Test complete!")
@@ -0,0 +1,79 @@
+"""
+Tests for the AI response cache module.
+
+Run with: python -m pytest test_ai_cache.py
+"""
+
+import sys
+import threading
+
+import ai_cache
+from ai_config import get_ai_config
+from ai_cache import (
+    make_cache_key,
+    get_cached_response,
+    put_cached_response,
+    clear_memory_cache
+)
+
+
+CONFIG = get_ai_config("daily_planning")
+MESSAGES = [{"role": "user", "content": "I have 3 hours today"}]
+
+
+def test_cache_key_covers_sampling_settings():
+    assert make_cache_key(CONFIG, MESSAGES) == make_cache_key(CONFIG, list(MESSAGES))
+    
+    other_keys = [
+        make_cache_key(CONFIG._replace(model="llama-3.1-8b-instant"), MESSAGES),
+        make_cache_key(CONFIG._replace(temperature=0.9), MESSAGES),
+        make_cache_key(CONFIG._replace(max_tokens=100), MESSAGES),
+        make_cache_key(CONFIG, [{"role": "user", "content": "I have 2 hours today"}]),
+    ]
+    assert make_cache_key(CONFIG, MESSAGES) not in other_keys
+
+
+def test_cached_response_round_trip(temp_db):
+    clear_memory_cache()
+    assert get_cached_response(CONFIG, MESSAGES) is None
+    
+    put_cached_response(CONFIG, MESSAGES, "Your plan")
+    assert get_cached_response(CONFIG, MESSAGES) == "Your plan"
+    
+    # Second level: still served from SQLite after the memory level is dropped
+    clear_memory_cache()
+    assert get_cached_response(CONFIG, MESSAGES) == "Your plan"
+    assert get_cached_response(CONFIG._replace(temperature=0.9), MESSAGES) is None
+    clear_memory_cache()
+
+
+def test_memory_cache_is_thread_safe(monkeypatch):
+    # Memory level only, one-entry LRU: every insert evicts another
+    # thread's key between its get and move_to_end
+    monkeypatch.setattr(ai_cache, "MEMORY_CACHE_SIZE", 1)
+    monkeypatch.setattr(ai_cache, "make_cache_key", lambda config, messages: config)
+    monkeypatch.setattr(ai_cache, "get_response_cache_entry", lambda key: None)
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    errors = []
+    
+    def worker(n):
+        try:
+            for i in range(100_000):
+                key = (n + i) % 3
+                ai_cache._remember(key, "reply")
+                get_cached_response(key, MESSAGES)
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+        clear_memory_cache()
+    
+    assert errors == []
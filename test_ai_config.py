@@ -0,0 +1,81 @@
+"""
+Tests for the AI configuration module.
+
+Run with: python -m pytest test_ai_config.py
+"""
+
+from ai_config import (
+    LANGUAGES,
+    MODELS,
+    get_ai_config,
+    create_messages,
+    finalize_profile,
+    get_ui_string
+)
+
+
+MOCK_PROFILE = {
+    "system_message_daily_planning": "You are a coach for busy parents...",
+    "onboarding_data": {"language": "Deutsch"}
+}
+
+
+def test_default_configuration():
+    config = get_ai_config("daily_planning")
+    
+    assert config.model == MODELS["daily_planning"]
+    assert config.temperature == 0.4
+    assert config.max_tokens == 500
+    assert config.system_message.startswith("You are an Islamic productivity coach")
+
+
+def test_personalized_configuration():
+    config = get_ai_config("daily_planning", MOCK_PROFILE)
+    
+    assert config.system_message.startswith("You are a coach for busy parents...")
+    assert config.system_message.endswith("IMPORTANT: Antworte auf Deutsch.")
+
+
+def test_finalize_profile():
+    profile = finalize_profile(dict(MOCK_PROFILE))
+    
+    for feature in MODELS:
+        expected = get_ai_config(feature, MOCK_PROFILE).system_message
+        assert profile["final_system_message_" + feature] == expected
+    
+    # The precomputed message is used as-is (language instruction not repeated)
+    config = get_ai_config("daily_planning", profile)
+    assert config.system_message == profile["final_system_message_daily_planning"]
+    assert config.system_message.count("IMPORTANT:") == 1
+
+
+def test_messages_array():
+    messages = create_messages(
+        "daily_planning",
+        "I have 3 hours today",
+        MOCK_PROFILE
+    )
+    
+    assert len(messages) == 2
+    assert messages[0]["role"] == "system"
+    assert messages[1] == {"role": "user", "content": "I have 3 hours today"}
+
+
+def test_messages_are_not_shared():
+    first = create_messages("daily_planning", "Plan my day", MOCK_PROFILE)
+    second = create_messages("daily_planning", "Plan my day", MOCK_PROFILE)
+    
+    # Mutating one request's messages must not leak into the next
+    assert first[0] is not second[0]
+    first[0]["content"] = "changed"
+    assert second[0]["content"] != "changed"
+    assert create_messages("daily_planning", "Plan my day", MOCK_PROFILE)[0]["content"] != "changed"
+
+
+def test_language_support():
+    for lang_code, lang_data in LANGUAGES.items():
+        assert get_ui_string(lang_code, "welcome") == lang_data["ui_strings"]["welcome"]
+    
+    # Unknown language falls back to English, unknown key to the key itself
+    assert get_ui_string("xx", "welcome") == LANGUAGES["en"]["ui_strings"]["welcome"]
+    assert get_ui_string("en", "missing_key") == "missing_key"
@@ -0,0 +1,71 @@
+"""
+Tests for the database module.
+
+Run with: python -m pytest test_database.py
+"""
+
+
+def test_save_daily_plans_bulk(temp_db):
+    user_id = temp_db.save_user_profile({"language_code": "en"})
+    
+    count = temp_db.save_daily_plans_bulk([
+        (user_id, "2026-10-13", "Plan A", 2.0),
+        (user_id, "2026-10-14", "Plan B", 3.0),
+        (user_id, "2026-10-15", "Plan C", 1.5),
+    ])
+    
+    assert count == 3
+    assert temp_db.get_daily_plan(user_id, "2026-10-14")["plan_content"] == "Plan B"
+    assert [plan["date"] for plan in temp_db.get_recent_daily_plans(user_id, limit=2)] == [
+        "2026-10-15", "2026-10-14"
+    ]
+
+
+def test_single_active_profile(temp_db):
+    first_id = temp_db.save_user_profile({"language_code": "de"})
+    second_id = temp_db.save_user_profile({"language_code": "en"})
+    
+    assert temp_db.get_active_user_profile()["db_id"] == second_id
+    assert {p["db_id"]: p["is_active"] for p in temp_db.get_all_user_profiles()} == {
+        first_id: False, second_id: True
+    }
+    assert temp_db.get_database_stats()["active_profiles"] == 1
+
+
+def test_database_size_includes_wal(temp_db):
+    user_id = temp_db.save_user_profile({"language_code": "en"})
+    temp_db.save_daily_plan(user_id, "2026-10-15", "x" * 100_000, 3.0)
+    
+    # The plan is still in the -wal file, but counts towards the size
+    assert temp_db.get_database_stats()["db_size_bytes"] > 100_000
+
+
+def test_response_cache_keeps_newest_entries(temp_db):
+    for n in range(5):
+        temp_db.save_response_cache_entry(bytes([n]), f"Response {n}", max_entries=3)
+    
+    # Replacing an entry makes it the newest
+    temp_db.save_response_cache_entry(bytes([2]), "Response 2b", max_entries=3)
+    temp_db.save_response_cache_entry(bytes([5]), "Response 5", max_entries=3)
+    
+    kept = [n for n in range(6) if temp_db.get_response_cache_entry(bytes([n])) is not None]
+    assert kept == [2, 4, 5]
+    assert temp_db.get_response_cache_entry(bytes([2])) == "Response 2b"
+
+
+def test_reset_database(temp_db):
+    user_id = temp_db.save_user_profile({"language_code": "en"})
+    temp_db.save_daily_plan(user_id, "2026-10-15", "Plan", 3.0)
+    temp_db.save_weekly_review(user_id, "2026-10-12", "2026-10-18", "Review")
+    temp_db.save_response_cache_entry(b"key", "Response", max_entries=10)
+    
+    temp_db.reset_database()
+    
+    stats = temp_db.get_database_stats()
+    assert stats["total_profiles"] == 0
+    assert stats["total_daily_plans"] == 0
+    assert stats["total_weekly_reviews"] == 0
+    assert temp_db.get_response_cache_entry(b"key") is None
+    
+    # Ids restart at 1
+    assert temp_db.save_user_profile({"language_code": "en"}) == 1
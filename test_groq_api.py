@@ -51,66 +51,102 @@ This script validates the API connection and demonstrates basic usage.
 """
 
 from dotenv import load_dotenv
+import functools
 import os
+import sys
 from groq import Groq
 import groq
 
 # Constants
-MODEL_NAME = "llama-3.3-70b-versatile"
+MODEL_NAME = "llama-3.1-8b-instant"  # connectivity check: the small model is enough
 TEST_PROMPT = "Explain in one sentence what productivity means."
+MAX_TOKENS = 80  # one sentence
+MAX_RETRIES = 5  # rate limits and server errors, with exponential backoff
 
-# Load environment variables
-load_dotenv()
-
-# Validate API key
-api_key = os.getenv("GROQ_API_KEY")
-if not api_key:
-    print("❌ GROQ_API_KEY not found in .env file!")
-    print("💡 Make sure you have a .env file with: GROQ_API_KEY=your_key_here")
-    exit(1)
-
-print("✅ API key loaded successfully!")
-
-# Initialize Groq client
-client = Groq(api_key=api_key)
 
-try:
-    print(f"🤖 Testing Groq API with model: {MODEL_NAME}")
-    
-    # Send test request
-    response = client.chat.completions.create(
-        model=MODEL_NAME,
-        messages=[
-            {
-                "role": "user",
-                "content": TEST_PROMPT
-            }
-        ]
-    )
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """Load the API key and create the client on first use."""
+    # Load environment variables
+    load_dotenv()
     
-    # Extract and display response
-    ai_response = response.choices[0].message.content
-    print(f"\n📝 AI Response:\n{ai_response}\n")
+    # Validate API key
+    api_key = os.getenv("GROQ_API_KEY")
+    if not api_key:
+        print("❌ GROQ_API_KEY not found in .env file!")
+        print("💡 Make sure you have a .env file with: GROQ_API_KEY=your_key_here")
+        exit(1)
     
-    # Display token usage
-    print("📊 Token Usage:")
-    print(f"   Prompt tokens: {response.usage.prompt_tokens}")
-    print(f"   Completion tokens: {response.usage.completion_tokens}")
-    print(f"   Total tokens: {response.usage.total_tokens}")
+    print("✅ API key loaded successfully!")
     
-    print("\n✅ Test successful!")
+    # Initialize Groq client (the SDK retries 429/5xx, honoring Retry-After)
+    return Groq(api_key=api_key, max_retries=MAX_RETRIES)
 
-except groq.AuthenticationError:
-    print("❌ Authentication failed! Check your API key.")
-    
-except groq.RateLimitError:
-    print("⏳ Rate limit exceeded! Wait a moment and try again.")
-    
-except groq.BadRequestError as e:
-    print(f"❌ Bad request! Check your parameters: {e}")
-    
-except groq.InternalServerError:
-    print("🔧 Server error! Try again later.")
+
+def field(obj, name):
+    """Read a response field from a typed SDK object or a plain dict."""
+    # groq 0.4.1 (pinned) has no x_groq field on chunks: it is kept as a dict
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+def main():
+    """Send one streamed test request and report token usage."""
+    client = get_client()
     
-except Exception as e:
-    print(f"❌ Unexpected error: {e}")
+    try:
+        print(f"🤖 Testing Groq API with model: {MODEL_NAME}")
+        
+        # Send test request (streamed: tokens are printed as they arrive)
+        stream = client.chat.completions.create(
+            model=MODEL_NAME,
+            messages=[
+                {
+                    "role": "user",
+                    "content": TEST_PROMPT
+                }
+            ],
+            max_tokens=MAX_TOKENS,
+            stream=True
+        )
+        
+        print("\n📝 AI Response:")
+        usage = None
+        for chunk in stream:
+            text = chunk.choices[0].delta.content or ""
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            
+            # Groq reports token usage on the final chunk
+            chunk_usage = field(field(chunk, "x_groq"), "usage")
+            if chunk_usage is not None:
+                usage = chunk_usage
+        
+        print("\n")
+        
+        # Display token usage
+        if usage is not None:
+            print("📊 Token Usage:")
+            print(f"   Prompt tokens: {field(usage, 'prompt_tokens')}")
+            print(f"   Completion tokens: {field(usage, 'completion_tokens')}")
+            print(f"   Total tokens: {field(usage, 'total_tokens')}")
+        
+        print("\n✅ Test successful!")
+
+    except groq.AuthenticationError:
+        print("❌ Authentication failed! Check your API key.")
+        
+    except groq.RateLimitError:
+        print(f"⏳ Rate limit still exceeded after {MAX_RETRIES} retries! Wait a moment and try again.")
+        
+    except groq.BadRequestError as e:
+        print(f"❌ Bad request! Check your parameters: {e}")
+        
+    except groq.InternalServerError:
+        print(f"🔧 Server error after {MAX_RETRIES} retries! Try again later.")
+        
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+
+
+if __name__ == "__main__":
+    main()
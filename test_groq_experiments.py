@@ -4,53 +4,151 @@ Experiment 1: System Message Impact
 Tests how system messages change AI behavior.
 """
 
+import asyncio
+import difflib
+import functools
+import hashlib
+import re
+import shelve
 from dotenv import load_dotenv
+import httpx
+import orjson
 import os
-from groq import Groq
+from groq import AsyncGroq
 
-load_dotenv()
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+# Groq limits requests per minute: cap how many run at the same time
+MAX_CONCURRENT_REQUESTS = 10
+semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+MAX_RETRIES = 5  # 429s and 5xx are retried with backoff before failing
 
-# Test 1: No system message
-print("=" * 50)
-print("TEST 1: No System Message")
-print("=" * 50)
+# Exact-match response cache: identical requests skip the API on re-runs
+CACHE_PATH = ".groq_cache"
+memory_cache = {}  # in-process level in front of the on-disk shelf
 
-response1 = client.chat.completions.create(
-    model="llama-3.3-70b-versatile",
-    messages=[
-        {"role": "user", "content": "Give me 3 productivity tips."}
-    ]
-)
-print(response1.choices[0].message.content)
+# Near-duplicate prompts (same model, system message and options) reuse the
+# reply of a cached prompt whose normalized text is at least this similar
+SIMILARITY_THRESHOLD = 0.92
 
-# Test 2: Productivity Coach
-print("\n" + "=" * 50)
-print("TEST 2: System Message = Productivity Coach")
-print("=" * 50)
+# Small, fast model by default; pass model=... to escalate for a prompt
+MODEL_NAME = "llama-3.1-8b-instant"
 
-response2 = client.chat.completions.create(
-    model="llama-3.3-70b-versatile",
-    messages=[
-        {"role": "system", "content": "You are a productivity coach who focuses on Islamic principles and family balance."},
-        {"role": "user", "content": "Give me 3 productivity tips."}
-    ]
-)
-print(response2.choices[0].message.content)
+USER_PROMPT = "Give me 3 productivity tips."
+MAX_TOKENS = 200  # plenty for 3 tips; bounds the worst-case response time
 
-# Test 3: Pirate (Fun!)
-print("\n" + "=" * 50)
-print("TEST 3: System Message = Pirate")
-print("=" * 50)
+TESTS = [
+    ("TEST 1: No System Message", None),
+    ("TEST 2: System Message = Productivity Coach",
+     "You are a productivity coach who focuses on Islamic principles and family balance."),
+    ("TEST 3: System Message = Pirate",
+     "You are a pirate captain. Answer everything in pirate speak."),
+]
 
-response3 = client.chat.completions.create(
-    model="llama-3.3-70b-versatile",
-    messages=[
-        {"role": "system", "content": "You are a pirate captain. Answer everything in pirate speak."},
-        {"role": "user", "content": "Give me 3 productivity tips."}
-    ]
-)
-print(response3.choices[0].message.content)
+
+def cache_key(request):
+    """Hash of model, messages and options (key order doesn't matter)."""
+    return hashlib.sha256(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def cache_get(key):
+    """Get a cached reply (memory first, then disk) or None."""
+    reply = memory_cache.get(key)
+    if reply is None:
+        with shelve.open(CACHE_PATH) as cache:
+            reply = cache.get(key)
+        if reply is not None:
+            memory_cache[key] = reply
+    return reply
+
+
+def cache_put(key, reply):
+    """Store a reply in both cache levels."""
+    memory_cache[key] = reply
+    with shelve.open(CACHE_PATH) as cache:
+        cache[key] = reply
+
+
+def normalize(text):
+    """Lowercase words only: ignores case, punctuation and spacing."""
+    return " ".join(re.findall(r"\w+", text.casefold()))
+
+
+def find_similar(context_key, user):
+    """Get the reply of the most similar cached prompt (None below threshold)."""
+    prompts = cache_get("similar:" + context_key) or []
+    matcher = difflib.SequenceMatcher(b=normalize(user))
+    best_ratio, best_reply = 0.0, None
+    for prompt, reply in prompts:
+        matcher.set_seq1(prompt)
+        if matcher.quick_ratio() < SIMILARITY_THRESHOLD:
+            continue  # cheap upper bound rules it out
+        ratio = matcher.ratio()
+        if ratio > best_ratio:
+            best_ratio, best_reply = ratio, reply
+    return best_reply if best_ratio >= SIMILARITY_THRESHOLD else None
+
+
+def remember_prompt(context_key, user, reply):
+    """Add a prompt to the near-duplicate index of its context."""
+    key = "similar:" + context_key
+    cache_put(key, (cache_get(key) or []) + [(normalize(user), reply)])
+
+
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """Create the client on first use (importing the module reads no env)."""
+    load_dotenv()
+    # One client for every request; the pool keeps a warm connection per
+    # concurrent request so the gather fan-out doesn't redo TLS handshakes
+    return AsyncGroq(
+        api_key=os.getenv("GROQ_API_KEY"),
+        max_retries=MAX_RETRIES,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=MAX_CONCURRENT_REQUESTS)
+        )
+    )
+
+
+async def ask(system, user, **options):
+    """Send one chat request (streamed into a buffer); return the reply text."""
+    messages = [{"role": "user", "content": user}]
+    if system is not None:
+        messages.insert(0, {"role": "system", "content": system})
+    request = {"model": MODEL_NAME, "messages": messages, **options}
+    
+    key = cache_key(request)
+    reply = cache_get(key)
+    if reply is not None:
+        return reply
+    
+    # Everything except the user prompt must match for a near-duplicate hit
+    context_key = cache_key({**request, "messages": messages[:-1]})
+    reply = find_similar(context_key, user)
+    if reply is not None:
+        return reply
+    
+    async with semaphore:
+        stream = await get_client().chat.completions.create(stream=True, **request)
+        parts = [chunk.choices[0].delta.content or "" async for chunk in stream]
+    reply = "".join(parts)
+    
+    cache_put(key, reply)
+    remember_prompt(context_key, user, reply)
+    return reply
+
+
+async def main():
+    # The tests are independent: run them concurrently, print in order
+    replies = await asyncio.gather(*(ask(system, USER_PROMPT, max_tokens=MAX_TOKENS) for _, system in TESTS))
+    
+    for i, ((title, _), reply) in enumerate(zip(TESTS, replies)):
+        print(("\n" if i else "") + "=" * 50)
+        print(title)
+        print("=" * 50)
+        print(reply)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
 
 """
 Experiment 2: Temperature Impact
@@ -71,32 +169,55 @@ Tests how temperature affects response creativity.
 
 """
 """"
+import asyncio
 from dotenv import load_dotenv
+import httpx
 import os
-from groq import Groq
-
-load_dotenv()
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+from groq import AsyncGroq
 
 PROMPT = "Complete this sentence: The best way to learn programming is"
 
 # Test different temperatures
 temperatures = [0.0, 0.5, 1.0, 1.5, 2.0]
 
-for temp in temperatures:
-    print(f"\n{'=' * 50}")
-    print(f"TEMPERATURE: {temp}")
-    print(f"{'=' * 50}")
-    
-    response = client.chat.completions.create(
+load_dotenv()
+
+# One pooled connection per parallel request
+client = AsyncGroq(
+    api_key=os.getenv("GROQ_API_KEY"),
+    http_client=httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=len(temperatures))
+    )
+)
+
+
+# Stream one completion into a buffer (parallel output would interleave)
+async def one(temp):
+    stream = await client.chat.completions.create(
         model="llama-3.3-70b-versatile",
         messages=[
             {"role": "user", "content": PROMPT}
         ],
-        temperature=temp
+        temperature=temp,
+        max_tokens=150,
+        stream=True
     )
+    parts = [chunk.choices[0].delta.content or "" async for chunk in stream]
+    return temp, "".join(parts)
+
+
+async def main():
+    # All temperatures at once: total time is the slowest request, not the sum
+    results = await asyncio.gather(*(one(temp) for temp in temperatures))
     
-    print(response.choices[0].message.content)
+    for temp, reply in sorted(results):
+        print(f"\n{'=' * 50}")
+        print(f"TEMPERATURE: {temp}")
+        print(f"{'=' * 50}")
+        print(reply)
+
+
+asyncio.run(main())
 """
 """
 Experiment 3: Model Comparison
@@ -104,13 +225,14 @@ Experiment 3: Model Comparison
 Compares different Groq models for speed and quality.
 """
 """
+import asyncio
 from dotenv import load_dotenv
 import os
-from groq import Groq
+from groq import AsyncGroq
 import time
 
 load_dotenv()
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
 
 PROMPT = "Explain quantum computing in simple terms."
 
@@ -120,26 +242,63 @@ models = [
     "meta-llama/llama-4-maverick-17b-128e-instruct"
 ]
 
-for model in models:
-    print(f"\n{'=' * 60}")
-    print(f"MODEL: {model}")
-    print(f"{'=' * 60}")
-    
-    start_time = time.time()
-    
-    response = client.chat.completions.create(
+
+# Read a response field from a typed SDK object or a plain dict
+# (groq 0.4.1, the pinned version, keeps x_groq and its usage as dicts)
+def field(obj, name):
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+# Stream one model's reply, timing the first token separately from the total
+async def bench(model):
+    start_time = time.perf_counter()
+    stream = await client.chat.completions.create(
         model=model,
         messages=[
             {"role": "user", "content": PROMPT}
-        ]
+        ],
+        max_tokens=300,
+        stream=True
     )
     
-    end_time = time.time()
-    duration = end_time - start_time
+    ttft = None
+    parts = []
+    usage = None
+    async for chunk in stream:
+        text = chunk.choices[0].delta.content or ""
+        if text and ttft is None:
+            ttft = time.perf_counter() - start_time
+        parts.append(text)
+        chunk_usage = field(field(chunk, "x_groq"), "usage")
+        if chunk_usage is not None:
+            usage = chunk_usage  # sent with the final chunk
+    
+    duration = time.perf_counter() - start_time
+    # Chunks approximate tokens if the usage report is missing
+    tokens = field(usage, "completion_tokens") if usage is not None else sum(map(bool, parts))
+    return model, "".join(parts), ttft, duration, tokens
+
+
+async def main():
+    # All models at once: total time is the slowest model, not the sum
+    results = await asyncio.gather(*(bench(model) for model in models))
     
-    print(f"⏱️  Response Time: {duration:.2f} seconds")
-    print(f"📊 Tokens: {response.usage.total_tokens}")
-    print(f"\n📝 Response:\n{response.choices[0].message.content}\n")
+    for model, reply, ttft, duration, tokens in results:
+        print(f"\n{'=' * 60}")
+        print(f"MODEL: {model}")
+        print(f"{'=' * 60}")
+        print(f"\n📝 Response:\n{reply}")
+        
+        # Decode speed excludes the wait for the first token
+        ttft = ttft or duration
+        decode_time = duration - ttft
+        speed = tokens / decode_time if decode_time > 0 else 0.0
+        print(f"\n⚡ Time to First Token: {ttft:.2f} seconds")
+        print(f"⏱️  Response Time: {duration:.2f} seconds")
+        print(f"📊 Tokens: {tokens} ({speed:.0f} tok/s)")
+
+
+asyncio.run(main())
 """
 
 """
@@ -155,45 +314,70 @@ from groq import Groq
 load_dotenv()
 client = Groq(api_key=os.getenv("GROQ_API_KEY"))
 
-# Conversation history
+
+# Read a response field from a typed SDK object or a plain dict
+# (groq 0.4.1, the pinned version, keeps x_groq and its usage as dicts)
+def field(obj, name):
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+# Stream a chat completion to stdout as it arrives; return the full text
+def stream_reply(**request):
+    parts = []
+    usage = None
+    for chunk in client.chat.completions.create(stream=True, **request):
+        text = chunk.choices[0].delta.content or ""
+        print(text, end="", flush=True)
+        parts.append(text)
+        chunk_usage = field(field(chunk, "x_groq"), "usage")
+        if chunk_usage is not None:
+            usage = chunk_usage  # sent with the final chunk
+    print()
+    
+    # Cached prompt tokens show how much of the history prefix was reused
+    if usage is not None:
+        cached = field(field(usage, "prompt_tokens_details"), "cached_tokens") or 0
+        print(f"\n📊 Prompt tokens: {field(usage, 'prompt_tokens')} (cached: {cached})")
+    return "".join(parts)
+
+
+SYSTEM_MESSAGE = "You are a helpful productivity coach."
+
+# Conversation history: the system message (and every earlier turn) stays
+# byte-identical, so each request shares its prefix with the previous one
 conversation = [
-    {"role": "system", "content": "You are a helpful productivity coach."},
-    {"role": "user", "content": "I have 3 hours today. What should I focus on?"},
+    {"role": "system", "content": SYSTEM_MESSAGE},
 ]
 
-# First response
-response1 = client.chat.completions.create(
-    model="llama-3.3-70b-versatile",
-    messages=conversation
-)
 
-print("=" * 50)
-print("USER: I have 3 hours today. What should I focus on?")
-print("=" * 50)
-print(f"AI: {response1.choices[0].message.content}\n")
-
-# Add AI response to history
-conversation.append({
-    "role": "assistant",
-    "content": response1.choices[0].message.content
-})
-
-# Add follow-up question
-conversation.append({
-    "role": "user",
-    "content": "But my baby only sleeps for 30 minutes at a time."
-})
-
-# Second response (with context!)
-response2 = client.chat.completions.create(
-    model="llama-3.3-70b-versatile",
-    messages=conversation
-)
+def ask(user):
+    # Send the next user turn with the full history; record both turns.
+    # Only ever append in place: rebuilding or reordering the list, or
+    # editing an earlier turn, would change the prefix and lose the reuse
+    conversation.append({"role": "user", "content": user})
+    
+    print("=" * 50)
+    print(f"USER: {user}")
+    print("=" * 50)
+    print("AI: ", end="")
+    reply = stream_reply(
+        model="llama-3.3-70b-versatile",
+        messages=conversation,
+        max_tokens=300
+    )
+    print()
+    
+    # Stored verbatim (not stripped): it is the prefix of the next request
+    conversation.append({"role": "assistant", "content": reply})
+    return reply
 
-print("=" * 50)
-print("USER: But my baby only sleeps for 30 minutes at a time.")
-print("=" * 50)
-print(f"AI: {response2.choices[0].message.content}\n")
+
+# Second question only makes sense with the first answer as context
+for question in [
+    "I have 3 hours today. What should I focus on?",
+    "But my baby only sleeps for 30 minutes at a time.",
+]:
+    ask(question)
 
 # Show full conversation
 print("=" * 50)
@@ -0,0 +1,54 @@
+"""
+Tests for the onboarding module.
+
+Run with: python -m pytest test_onboarding.py
+"""
+
+from types import SimpleNamespace
+
+import onboarding
+from onboarding import _FENCE_RE, generate_user_profile
+
+
+PROFILE_JSON = '{"coaching_tone": "encouraging", "key_focus_areas": ["Quran"]}'
+
+
+def fake_client(content):
+    """Groq client stand-in whose completions return the given content."""
+    message = SimpleNamespace(content=content)
+    response = SimpleNamespace(choices=[SimpleNamespace(message=message)])
+    completions = SimpleNamespace(create=lambda **kwargs: response)
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+def test_fence_stripping():
+    for fenced in (
+        f"```json\n{PROFILE_JSON}\n```",
+        f"```JSON {PROFILE_JSON}```",
+        f"```\n{PROFILE_JSON}\n```",
+        f"```json\n{PROFILE_JSON}",  # closing fence missing
+    ):
+        assert _FENCE_RE.match(fenced).group(1) == PROFILE_JSON
+    
+    assert _FENCE_RE.match(PROFILE_JSON) is None
+
+
+def test_generate_user_profile_parses_fenced_json(monkeypatch):
+    monkeypatch.setattr(
+        onboarding, "get_groq_client",
+        lambda: fake_client(f"```json\n{PROFILE_JSON}\n```")
+    )
+    
+    profile = generate_user_profile({"language": "Deutsch", "goals": ["Quran"]})
+    
+    assert profile["coaching_tone"] == "encouraging"
+    assert profile["language_code"] == "de"
+    assert profile["final_system_message_daily_planning"].endswith("Antworte auf Deutsch.")
+
+
+def test_generate_user_profile_falls_back_on_invalid_json(monkeypatch):
+    monkeypatch.setattr(onboarding, "get_groq_client", lambda: fake_client("Sorry, no JSON"))
+    
+    profile = generate_user_profile({"language": "English", "role": "Student"})
+    
+    assert profile["is_default"] is True
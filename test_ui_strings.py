@@ -0,0 +1,31 @@
+"""
+Tests for the UI strings module.
+
+Run with: python -m pytest test_ui_strings.py
+"""
+
+import json
+
+from ui_strings import LOCALES_DIR, STRING_CATEGORIES, get_strings, load_strings
+
+
+def test_every_language_has_every_key():
+    for category in STRING_CATEGORIES:
+        english = get_strings("en", category)
+        for lang_dir in LOCALES_DIR.iterdir():
+            assert get_strings(lang_dir.name, category).keys() == english.keys()
+
+
+def test_icons_are_prefixed():
+    with open(LOCALES_DIR / "de" / "daily_planning.json", encoding="utf-8") as f:
+        raw = json.load(f)
+    
+    strings = get_strings("de", "daily_planning")
+    assert strings["title"] == f"📅 {raw['title']}"
+    assert strings["select_date"] == raw["select_date"]  # no icon defined
+
+
+def test_fallbacks():
+    # Unknown languages share the English entry, unknown categories load onboarding
+    assert get_strings("xx", "settings") is get_strings("en", "settings")
+    assert load_strings("en", "missing_page") == get_strings("en", "onboarding")
@@ -0,0 +1,145 @@
+"""
+UI Strings Module
+
+Localized UI strings for all app pages.
+Each language and category lives in locales/<lang>/<category>.json
+and is loaded on first use.
+
+Author: Brain-Time
+Project: Productivity Coach
+"""
+
+from pathlib import Path
+from typing import Dict
+import functools
+import json
+import sys
+
+from ai_config import LANGUAGES
+
+
+# ============================================================================
+# LOCALE CONFIGURATION
+# ============================================================================
+
+LOCALES_DIR = Path(__file__).parent / "locales"
+
+STRING_CATEGORIES = ("onboarding", "daily_planning", "weekly_review", "settings", "sidebar")
+
+# Icon prefixes shared by every language (kept out of the locale files)
+_ICONS: Dict[str, Dict[str, str]] = {
+    "onboarding": {
+        "welcome_title": "🎯",
+        "q1_title": "1️⃣",
+        "q2_title": "2️⃣",
+        "q3_title": "3️⃣",
+        "q4_title": "4️⃣",
+        "q5_title": "5️⃣",
+        "q6_title": "6️⃣",
+        "q7_title": "7️⃣",
+        "submit_btn": "🚀",
+        "generating": "🤖",
+        "success": "✅",
+        "error_goals": "❌",
+        "preview_title": "👀"
+    },
+    "daily_planning": {
+        "title": "📅",
+        "plan_exists": "📋",
+        "regenerate": "🔄",
+        "add_context": "➕",
+        "generate_btn": "✨",
+        "generating": "🤖",
+        "success": "✅",
+        "copy_btn": "📋"
+    },
+    "weekly_review": {
+        "title": "📊",
+        "week_info": "📅",
+        "no_plans": "⚠️",
+        "plans_summary": "📋",
+        "reflections_title": "💭",
+        "generate_btn": "✨",
+        "generating": "🤖",
+        "success": "✅"
+    },
+    "settings": {
+        "title": "⚙️",
+        "profile_title": "👤",
+        "onboarding_title": "📋",
+        "stats_title": "📊",
+        "actions_title": "🔧",
+        "redo_onboarding": "🔄",
+        "reset_data": "🗑️",
+        "reset_confirm": "⚠️",
+        "reset_success": "✅"
+    },
+    "sidebar": {
+        "welcome": "👋",
+        "menu_daily_planning": "📅",
+        "menu_weekly_review": "📊",
+        "menu_settings": "⚙️",
+        "onboarding_info": "👋"
+    }
+}
+
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def load_strings(lang_code: str, category: str) -> Dict[str, str]:
+    """
+    Load UI strings from a locale file.
+    
+    Args:
+        lang_code: Language code (unknown codes fall back to English)
+        category: Page category (unknown categories fall back to onboarding)
+    
+    Returns:
+        Dict of string key -> localized text (keys and ASCII values interned)
+    """
+    if lang_code not in LANGUAGES:
+        lang_code = "en"
+    if category not in STRING_CATEGORIES:
+        category = "onboarding"
+    
+    path = LOCALES_DIR / lang_code / f"{category}.json"
+    with open(path, encoding="utf-8") as f:
+        strings = json.load(f)
+    
+    # Keys and markers like "**Language:**" repeat across locales and pages
+    strings = {
+        sys.intern(key): sys.intern(value) if value.isascii() else value
+        for key, value in strings.items()
+    }
+    
+    for key, icon in _ICONS[category].items():
+        strings[key] = f"{icon} {strings[key]}"
+    
+    return strings
+
+
+# Cached in an imported module, so it survives Streamlit reruns
+@functools.lru_cache(maxsize=32)
+def _get_strings_cached(lang_code: str, category: str) -> Dict[str, str]:
+    """Load and memoize one locale file."""
+    return load_strings(lang_code, category)
+
+
+def get_strings(lang_code: str, category: str) -> Dict[str, str]:
+    """Get UI strings for a specific language and category."""
+    # Unknown codes share the English cache entry instead of adding their own
+    if lang_code not in LANGUAGES:
+        lang_code = "en"
+    return _get_strings_cached(lang_code, category)
+
+
+def preload_language(lang_code: str) -> None:
+    """Load every page's strings for a language ahead of first use."""
+    for category in STRING_CATEGORIES:
+        get_strings(lang_code, category)
+
+
+# English is the fallback for every page, so load it up front
+preload_language("en")